@@ -1,34 +1,59 @@
-"""Pydantic settings for HALCYON media integrations."""
+"""Environment-backed settings for HALCYON media integrations."""
 from __future__ import annotations
 
-from typing import Optional
+import os
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional
 
-from pydantic import BaseSettings, Field
+try:  # pragma: no cover - optional .env support
+    from dotenv import load_dotenv
+except Exception:  # pragma: no cover - environment variables only
+    load_dotenv = None  # type: ignore
 
 
-class MediaSettings(BaseSettings):
+def _env(name: str, default: Any = None) -> Any:
+    return field(default=default, metadata={"env": name})
+
+
+@dataclass(frozen=True)
+class MediaSettings:
     """Configuration surface for Plex, Overseerr, and TMDB integrations."""
 
-    plex_base_url: Optional[str] = Field(default=None, env="PLEX_BASE_URL")
-    plex_token: Optional[str] = Field(default=None, env="PLEX_TOKEN")
-    plex_user_name: Optional[str] = Field(default=None, env="PLEX_USER_NAME")
+    plex_base_url: Optional[str] = _env("PLEX_BASE_URL")
+    plex_token: Optional[str] = _env("PLEX_TOKEN")
+    plex_user_name: Optional[str] = _env("PLEX_USER_NAME")
+
+    overseerr_base_url: Optional[str] = _env("OVERSEERR_BASE_URL")
+    overseerr_api_key: Optional[str] = _env("OVERSEERR_API_KEY")
+
+    tmdb_api_key: Optional[str] = _env("TMDB_API_KEY")
+
+    library_movies_section: str = _env("LIBRARY_MOVIES_SECTION", "Movies")
+    library_tv_section: str = _env("LIBRARY_TV_SECTION", "TV Shows")
+    default_media_player_entity: str = _env("DEFAULT_MEDIA_PLAYER_ENTITY", "media_player.living_room")
+
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ".env") -> "MediaSettings":
+        """Build settings from the process environment.
 
-    overseerr_base_url: Optional[str] = Field(default=None, env="OVERSEERR_BASE_URL")
-    overseerr_api_key: Optional[str] = Field(default=None, env="OVERSEERR_API_KEY")
+        ``env_file`` is loaded first (when python-dotenv is installed) without
+        overriding variables that are already set. Variable names are matched
+        case-insensitively.
+        """
 
-    tmdb_api_key: Optional[str] = Field(default=None, env="TMDB_API_KEY")
+        if env_file and load_dotenv is not None:
+            load_dotenv(env_file, encoding="utf-8", override=False)
+        environ = {key.upper(): value for key, value in os.environ.items()}
+        values: Dict[str, Any] = {}
+        for item in fields(cls):
+            name = item.metadata["env"]
+            if name in environ:
+                values[item.name] = environ[name]
+        return cls(**values)
 
-    library_movies_section: str = Field(default="Movies", env="LIBRARY_MOVIES_SECTION")
-    library_tv_section: str = Field(default="TV Shows", env="LIBRARY_TV_SECTION")
-    default_media_player_entity: str = Field(
-        default="media_player.living_room",
-        env="DEFAULT_MEDIA_PLAYER_ENTITY",
-    )
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+# Process-wide settings read from the environment at import time.
+settings = MediaSettings.from_env()
 
 
-__all__ = ["MediaSettings"]
+__all__ = ["MediaSettings", "settings"]
@@ -2,18 +2,50 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 try:  # pragma: no cover - optional redis dependency
     import redis
+
+    from orchestrator.context.redis_pool import get_client
 except Exception:  # pragma: no cover
     redis = None  # type: ignore
 
+try:  # pragma: no cover - optional accelerated codec
+    import orjson
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional binary codec
+    import msgpack
+except Exception:  # pragma: no cover - fall back to JSON blobs
+    msgpack = None  # type: ignore
+
 from orchestrator.logging.event_bus import EventBus
 from services.media.overseerr_client import OverseerrClient
 from services.media.recommender import MediaRecommender
 from ha_adapter.intents.intent_router import IntentContext, IntentResult
 
+# Persona-specific confirmations keyed by the upper-case ``IntentContext.persona``.
+_SPOKEN_REQUEST = {"SCARLET": "Request filed."}
+_SPOKEN_REQUEST_DEFAULT = "Added to your requests. I’ll notify you when it’s available."
+_SPOKEN_WATCHLIST = {"HALSTON": "Added to your watchlist."}
+_SPOKEN_WATCHLIST_DEFAULT = "Added."
+
+_TOPIC_MEDIA_ERROR = "media/error"
+
+
+@dataclass(slots=True)
+class MediaErrorEvent:
+    """Payload published on ``media/error`` when an Overseerr call fails."""
+
+    uuid: Optional[str]
+    code: str
+    message: str
+    ts: float = field(default_factory=time.time)
+
 
 class MediaIntentHandler:
     """Handle conversational media intents: recommend, request, watchlist."""
@@ -26,12 +58,15 @@ class MediaIntentHandler:
         event_bus: EventBus,
         redis_url: str = "redis://localhost:6379/0",
         cache_ttl: int = 900,
+        use_msgpack: bool = True,
     ) -> None:
         self._recommender = recommender
         self._overseerr = overseerr
         self._event_bus = event_bus
         self._cache_ttl = cache_ttl
+        self._use_msgpack = use_msgpack and msgpack is not None
         self._redis = self._init_redis(redis_url)
+        self._getex = getattr(self._redis, "getex", None)
 
     # ------------------------------------------------------------------
     def handle_recommend(self, ctx: IntentContext, slots: Dict[str, object]) -> IntentResult:
@@ -63,13 +98,9 @@ class MediaIntentHandler:
             result = self._overseerr.request(tmdb_id, choice.get("type", "movie"), user_note=None)
             ok = True
         except Exception as exc:  # pragma: no cover - defensive guard
-            self._event_bus.publish(
-                "media/error",
-                {
-                    "uuid": ctx.speaker_uuid,
-                    "code": "overseerr_request_error",
-                    "message": str(exc),
-                },
+            self._event_bus.publish_struct(
+                _TOPIC_MEDIA_ERROR,
+                MediaErrorEvent(uuid=ctx.speaker_uuid, code="overseerr_request_error", message=str(exc)),
             )
             return IntentResult(ok=False, spoken="I couldn't file that request.")
         self._event_bus.publish(
@@ -82,7 +113,7 @@ class MediaIntentHandler:
                 "ok": True,
             },
         )
-        spoken = "Request filed." if ctx.persona.upper() == "SCARLET" else "Added to your requests. I’ll notify you when it’s available."
+        spoken = _SPOKEN_REQUEST.get(ctx.persona, _SPOKEN_REQUEST_DEFAULT)
         return IntentResult(ok=True, spoken=spoken, details={"request": result})
 
     def handle_add_to_list(self, ctx: IntentContext, slots: Dict[str, object]) -> IntentResult:
@@ -99,41 +130,52 @@ class MediaIntentHandler:
         try:
             ok = self._overseerr.add_to_list(tmdb_id, list_name="watch-next")
         except Exception as exc:  # pragma: no cover - defensive guard
-            self._event_bus.publish(
-                "media/error",
-                {
-                    "uuid": ctx.speaker_uuid,
-                    "code": "overseerr_add_list_error",
-                    "message": str(exc),
-                },
+            self._event_bus.publish_struct(
+                _TOPIC_MEDIA_ERROR,
+                MediaErrorEvent(uuid=ctx.speaker_uuid, code="overseerr_add_list_error", message=str(exc)),
             )
             return IntentResult(ok=False, spoken="I couldn't add that to your list.")
         if not ok:
             return IntentResult(ok=False, spoken="I couldn't add that to your list.")
-        spoken = "Added to your watchlist." if ctx.persona.upper() == "HALSTON" else "Added."
+        spoken = _SPOKEN_WATCHLIST.get(ctx.persona, _SPOKEN_WATCHLIST_DEFAULT)
         return IntentResult(ok=True, spoken=spoken, details={"added": choice})
 
     # ------------------------------------------------------------------
     def _init_redis(self, redis_url: str):
         if redis is None:
             return None
-        return redis.from_url(redis_url, decode_responses=True)
+        # Offer blobs are binary (msgpack) or JSON bytes; both decode from raw bytes.
+        return get_client(redis_url, decode_responses=False)
 
     def _store_offers(self, ctx: IntentContext, options: List[Dict[str, Any]]) -> None:
         if self._redis is None:
             return
         key = self._key(ctx)
-        self._redis.set(key, json.dumps(options), ex=self._cache_ttl)
+        if self._use_msgpack:
+            payload = msgpack.packb(options, use_bin_type=True)
+        else:
+            payload = orjson.dumps(options) if orjson is not None else json.dumps(options)
+        self._redis.set(key, payload, ex=self._cache_ttl)
 
     def _load_offers(self, ctx: IntentContext) -> List[Dict[str, Any]]:
         if self._redis is None:
             return []
-        raw = self._redis.get(self._key(ctx))
+        key = self._key(ctx)
+        # Acting on an offer keeps the list alive for follow-ups ("and the second one")
+        # without a separate EXPIRE round trip.
+        raw = self._getex(key, ex=self._cache_ttl) if self._getex is not None else self._redis.get(key)
         if not raw:
             return []
+        if self._use_msgpack:
+            try:
+                offers = msgpack.unpackb(raw, raw=False)
+            except (msgpack.UnpackException, ValueError):
+                offers = None  # legacy JSON blob written before the msgpack switch
+            if isinstance(offers, list):
+                return offers
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
             return []
 
     def _key(self, ctx: IntentContext) -> str:
@@ -153,4 +195,4 @@ class MediaIntentHandler:
         return 1
 
 
-__all__ = ["MediaIntentHandler"]
+__all__ = ["MediaErrorEvent", "MediaIntentHandler"]
@@ -1,7 +1,9 @@
 """Intent routing to Home Assistant via MQTT."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
@@ -10,6 +12,16 @@ from services.event_bridge.homeassistant_mqtt import HAMQTTBridge
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from ha_adapter.intents.intent_media import MediaIntentHandler
 
+_SENSITIVE_INTENTS = frozenset({"unlock_door", "open_garage", "disarm_alarm"})
+# Media intents resolve against ``self._media`` at call time since the
+# orchestrator may attach the handler after the router is constructed.
+_MEDIA_HANDLERS: Dict[str, str] = {
+    "media_recommend": "handle_recommend",
+    "media_request": "handle_add_request",
+    "media_add_to_list": "handle_add_to_list",
+}
+_INTENT_PREFIX = "_intent_"
+
 
 class IntentContext(BaseModel):
     """Runtime context describing the caller's trust posture."""
@@ -25,15 +37,42 @@ class IntentContext(BaseModel):
     )
     speaker_uuid: Optional[str] = Field(default=None, description="Stable speaker UUID if known.")
     session_id: Optional[str] = Field(default=None, description="Temporary session identifier.")
-    persona: str = Field(default="HALSTON", description="Active persona label.")
+    persona: str = Field(default="HALSTON", description="Active persona label (upper-case).")
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        # Normalized once here so persona-keyed phrase tables can use plain lookups.
+        self.persona = self.persona.upper()
 
 
-class IntentResult(BaseModel):
-    """Result returned after attempting to fulfill an intent."""
+@dataclass(slots=True, frozen=True)
+class IntentResult:
+    """Result returned after attempting to fulfill an intent.
+
+    Built internally on every dispatch, so it skips model validation.
+    """
 
     ok: bool
     spoken: str
-    details: Dict[str, Any] = Field(default_factory=dict)
+    details: Mapping[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # A private copy: the result itself may be a shared cached instance.
+        return {"ok": self.ok, "spoken": self.spoken, "details": dict(self.details)}
+
+
+# Router replies are fixed phrases, so each (ok, spoken) pair is built once and
+# shared. Shared instances get a read-only empty details mapping.
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+_RESULT_CACHE: Dict[Tuple[bool, str], IntentResult] = {}
+
+
+def _cached_result(ok: bool, spoken: str) -> IntentResult:
+    key = (ok, spoken)
+    result = _RESULT_CACHE.get(key)
+    if result is None:
+        result = _RESULT_CACHE.setdefault(key, IntentResult(ok=ok, spoken=spoken, details=_NO_DETAILS))
+    return result
 
 
 class IntentRouter:
@@ -42,6 +81,9 @@ class IntentRouter:
     def __init__(self, mqtt_bridge: HAMQTTBridge, media_handler: "MediaIntentHandler" | None = None) -> None:
         self._mqtt = mqtt_bridge
         self._media = media_handler
+        self._dispatch: Dict[str, Callable[[Dict[str, Any], IntentContext], IntentResult]] = {
+            name[len(_INTENT_PREFIX):]: getattr(self, name) for name in dir(self) if name.startswith(_INTENT_PREFIX)
+        }
 
     # ------------------------------------------------------------------
     # Public API
@@ -52,20 +94,16 @@ class IntentRouter:
         if not normalized:
             return self._deny("I didn't catch that.")
 
-        if normalized in {"unlock_door", "open_garage", "disarm_alarm"}:
-            if not ctx.allow_sensitive:
-                return self._deny("That function is not available right now.")
+        if normalized in _SENSITIVE_INTENTS and not ctx.allow_sensitive:
+            return self._deny("That function is not available right now.")
 
-        if normalized in {"media_recommend", "media_request", "media_add_to_list"}:
+        media_method = _MEDIA_HANDLERS.get(normalized)
+        if media_method is not None:
             if self._media is None:
                 return self._deny("Media services are not configured.")
-            if normalized == "media_recommend":
-                return self._media.handle_recommend(ctx, slots)
-            if normalized == "media_request":
-                return self._media.handle_add_request(ctx, slots)
-            return self._media.handle_add_to_list(ctx, slots)
+            return getattr(self._media, media_method)(ctx, slots)
 
-        handler = getattr(self, f"_intent_{normalized}", None)
+        handler = self._dispatch.get(normalized)
         if handler is None:
             return self._deny("I can’t do that yet.")
         return handler(slots, ctx)
@@ -136,11 +174,12 @@ class IntentRouter:
     # ------------------------------------------------------------------
     # Helpers
     def _result(self, ok: bool, success: str, *, failure: str | None = None) -> IntentResult:
+        ok = bool(ok)
         spoken = success if ok else (failure or "I couldn't complete that.")
-        return IntentResult(ok=ok, spoken=spoken)
+        return _cached_result(ok, spoken)
 
     def _deny(self, reason: str) -> IntentResult:
-        return IntentResult(ok=False, spoken=reason)
+        return _cached_result(False, reason)
 
 
 __all__ = ["IntentRouter", "IntentContext", "IntentResult"]
@@ -1,13 +1,19 @@
 """HALSTON persona runtime implementation."""
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Dict, Iterable, Optional
+import re
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Pattern, Tuple
 
 from pydantic import BaseModel, Field
 
 from orchestrator.policy_engine.access_control import AccessDecision
 
+try:  # pragma: no cover - optional multi-pattern matcher
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - fall back to compiled regex alternations
+    ahocorasick = None  # type: ignore
+
 
 class IntentLexicon(BaseModel):
     """Configurable keyword to intent mapping."""
@@ -39,25 +45,39 @@ class HalstonAgent:
     def __init__(self, config: Optional[HalstonConfig] = None) -> None:
         self.config = config or HalstonConfig()
         self._history: Deque[ConversationMemory] = deque(maxlen=self.config.max_history)
-        self._lexicon = list(self.config.intent_lexicon)
+        self._intent_counts: Counter[str] = Counter()
+        self._lexicon: List[Tuple[str, Tuple[str, ...]]] = [
+            (lex.intent, tuple(keyword.lower() for keyword in lex.keywords if keyword))
+            for lex in self.config.intent_lexicon
+        ]
+        self._automaton: Any = None
+        self._patterns: List[Tuple[str, Pattern[str]]] = []
+        self._build_matchers()
 
     def infer_intent(self, text: str, hint: Optional[str] = None) -> str:
-        """Infer the most likely intent using lexicon matching."""
+        """Infer the most likely intent using lexicon matching.
+
+        Lexicon order decides ties: the earliest entry with any keyword present
+        in ``text`` wins, regardless of where in the text the keyword appears.
+        """
 
         if hint:
             return hint
 
         lowered = text.lower()
-        for lex in self._lexicon:
-            if any(keyword.lower() in lowered for keyword in lex.keywords):
-                return lex.intent
+        if self._automaton is not None:
+            best = min((value for _, value in self._automaton.iter(lowered)), default=None)
+            return best[1] if best is not None else self.config.fallback_intent
+        for intent, pattern in self._patterns:
+            if pattern.search(lowered):
+                return intent
         return self.config.fallback_intent
 
     def generate_response(self, text: str, *, intent: Optional[str], metadata: Dict[str, object]) -> str:
         """Generate a response string informed by prior history."""
 
         intent_name = intent or self.config.fallback_intent
-        self._history.append(ConversationMemory(user_text=text, intent=intent_name))
+        self._remember(ConversationMemory(user_text=text, intent=intent_name))
         context_summary = self._summarize_context()
         polite_prefix = "Certainly." if intent_name != self.config.fallback_intent else "Of course."
         response = (
@@ -87,11 +107,36 @@ class HalstonAgent:
 
     # Internal helpers -------------------------------------------------
 
+    def _build_matchers(self) -> None:
+        entries = [(intent, keywords) for intent, keywords in self._lexicon if keywords]
+        self._patterns = [
+            (intent, re.compile("|".join(map(re.escape, keywords)))) for intent, keywords in entries
+        ]
+        if ahocorasick is None or not entries:
+            return
+        automaton = ahocorasick.Automaton()
+        for rank, (intent, keywords) in enumerate(entries):
+            for keyword in keywords:
+                if automaton.get(keyword, None) is None:
+                    automaton.add_word(keyword, (rank, intent))
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def _remember(self, entry: ConversationMemory) -> None:
+        """Append to history while keeping ``_intent_counts`` in step with evictions."""
+
+        if len(self._history) == self._history.maxlen:
+            evicted = self._history[0].intent
+            self._intent_counts[evicted] -= 1
+            if not self._intent_counts[evicted]:
+                del self._intent_counts[evicted]
+        self._history.append(entry)
+        self._intent_counts[entry.intent] += 1
+
     def _summarize_context(self) -> str:
-        if not self._history:
+        if not self._intent_counts:
             return ""
-        intents = {entry.intent for entry in self._history}
-        if len(intents) == 1:
-            intent = next(iter(intents))
+        if len(self._intent_counts) == 1:
+            intent = next(iter(self._intent_counts))
             return f"a series of '{intent}' tasks"
         return "a mixture of tasks"
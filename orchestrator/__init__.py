@@ -1,4 +1,8 @@
 """HALCYON orchestrator package with lazy re-exports."""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
 
 __all__ = [
     "EventBus",
@@ -9,22 +13,21 @@ __all__ = [
     "SessionStore",
 ]
 
+# Exported name -> (submodule, attribute); resolved once, then cached in globals().
+_LOADERS: Dict[str, Tuple[str, str]] = {
+    "EventBus": (".logging.event_bus", "EventBus"),
+    "MessageRouter": (".routing.message_router", "MessageRouter"),
+    "RouterConfig": (".routing.message_router", "RouterConfig"),
+    "SessionStore": (".context.session_state", "SessionStore"),
+    "Orchestrator": (".orchestrator", "Orchestrator"),
+    "OrchestratorDependencies": (".orchestrator", "OrchestratorDependencies"),
+}
 
-def __getattr__(name: str):  # pragma: no cover - simple proxy
-    if name in {"EventBus"}:
-        from .logging.event_bus import EventBus
-
-        return EventBus
-    if name in {"MessageRouter", "RouterConfig"}:
-        from .routing.message_router import MessageRouter, RouterConfig
-
-        return {"MessageRouter": MessageRouter, "RouterConfig": RouterConfig}[name]
-    if name in {"SessionStore"}:
-        from .context.session_state import SessionStore
-
-        return SessionStore
-    if name in {"Orchestrator", "OrchestratorDependencies"}:
-        from .orchestrator import Orchestrator, OrchestratorDependencies
 
-        return {"Orchestrator": Orchestrator, "OrchestratorDependencies": OrchestratorDependencies}[name]
-    raise AttributeError(name)
+def __getattr__(name: str) -> Any:  # pragma: no cover - simple proxy
+    target = _LOADERS.get(name)
+    if target is None:
+        raise AttributeError(name)
+    value = getattr(import_module(target[0], __name__), target[1])
+    globals()[name] = value
+    return value
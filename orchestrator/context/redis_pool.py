@@ -0,0 +1,33 @@
+"""Process-wide Redis connection pools shared by HALCYON components."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import redis
+
+
+@lru_cache(maxsize=8)
+def get_pool(redis_url: str, *, decode_responses: bool = True) -> "redis.ConnectionPool":
+    """Return the shared connection pool for ``redis_url``.
+
+    redis-py ignores client-level connection options once a pool is supplied,
+    so response decoding is part of the pool identity.
+    """
+
+    return redis.ConnectionPool.from_url(
+        redis_url,
+        max_connections=32,
+        socket_keepalive=True,
+        health_check_interval=30,
+        retry_on_timeout=True,
+        decode_responses=decode_responses,
+    )
+
+
+def get_client(redis_url: str, *, decode_responses: bool = True) -> "redis.Redis":
+    """Return a Redis client bound to the shared pool for ``redis_url``."""
+
+    return redis.Redis(connection_pool=get_pool(redis_url, decode_responses=decode_responses))
+
+
+__all__ = ["get_client", "get_pool"]
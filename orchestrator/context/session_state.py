@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import json
+import sys
 import time
-from dataclasses import asdict, dataclass
-from typing import Optional
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Callable, Dict, Optional, Tuple, get_type_hints
 
-import redis
+from redis.exceptions import ResponseError
 
+from orchestrator.context.redis_pool import get_client
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionState:
     """Serializable representation of a speaker session."""
 
@@ -27,15 +30,48 @@ class SessionState:
     last_response: Optional[str] = None
 
 
+def _optional_float(value: str) -> Optional[float]:
+    return float(value) if value else None
+
+
+def _optional_str(value: str) -> Optional[str]:
+    return value or None
+
+
+# Plain ``str`` fields (persona, context mode) come from a tiny vocabulary, so they
+# are interned: every loaded session shares the same objects as the literals used
+# in trust scoring and event payloads, instead of fresh per-load copies.
+# Keyed on resolved types, so ``Optional[float]`` and ``float | None`` match alike.
+_DECODERS_BY_TYPE: Dict[Any, Callable[[str], Any]] = {
+    str: sys.intern,
+    float: float,
+    int: int,
+    Optional[str]: _optional_str,
+    Optional[float]: _optional_float,
+}
+
+# Hash fields come back as strings; ``None`` is stored as an empty string.
+# Built once in declaration order so decoding binds ``SessionState`` positionally.
+_FIELD_NAMES: Tuple[str, ...] = tuple(item.name for item in fields(SessionState))
+_FIELD_TYPES = get_type_hints(SessionState)
+_FIELD_DECODERS: Tuple[Tuple[str, Callable[[str], Any], Any], ...] = tuple(
+    (item.name, _DECODERS_BY_TYPE[_FIELD_TYPES[item.name]], None if item.default is MISSING else item.default)
+    for item in fields(SessionState)
+)
+
+
 class SessionStore:
     """Redis-backed shared session cache.
 
     The store keeps session state shared across microphones and devices so
-    persona and trust hysteresis remain stable within a household.
+    persona and trust hysteresis remain stable within a household. Each
+    session is a Redis hash so single-field updates avoid a read-modify-write.
+    Sessions written by older releases as JSON strings are converted to hashes
+    the first time they are loaded or touched.
     """
 
     def __init__(self, redis_url: str = "redis://localhost:6379/0", ttl_seconds: int = 3600) -> None:
-        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self._redis = get_client(redis_url)
         self._ttl = ttl_seconds
 
     def _key(self, speaker_uuid: Optional[str], temp_id: str) -> str:
@@ -45,23 +81,67 @@ class SessionStore:
 
     def load(self, speaker_uuid: Optional[str], temp_id: str) -> SessionState:
         key = self._key(speaker_uuid, temp_id)
-        raw = self._redis.get(key)
-        if raw is None:
-            return SessionState(speaker_uuid=speaker_uuid, last_seen_ts=time.time())
-        data = json.loads(raw)
-        return SessionState(**data)
+        try:
+            data = self._redis.hgetall(key)
+        except ResponseError:
+            data = self._migrate_legacy(key)
+        return self._decode(data, speaker_uuid)
+
+    def save(self, state: SessionState, speaker_uuid: Optional[str], temp_id: str, *, pipe: Any = None) -> None:
+        """Persist ``state``; pass ``pipe`` to queue the write on a caller's pipeline."""
 
-    def save(self, state: SessionState, speaker_uuid: Optional[str], temp_id: str) -> None:
         key = self._key(speaker_uuid, temp_id)
         state.speaker_uuid = speaker_uuid
         state.last_seen_ts = time.time()
-        payload = json.dumps(asdict(state))
-        self._redis.set(key, payload, ex=self._ttl)
+        if pipe is not None:
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._encode(state))
+            pipe.expire(key, self._ttl)
+            return
+        with self._redis.pipeline(transaction=True) as own:
+            own.delete(key)  # every field is rewritten; also replaces a legacy string value
+            own.hset(key, mapping=self._encode(state))
+            own.expire(key, self._ttl)
+            own.execute()
+
+    def pipeline(self, transaction: bool = True) -> Any:
+        """Return a Redis pipeline so callers can batch writes into one round trip."""
+
+        return self._redis.pipeline(transaction=transaction)
 
     def touch_context(self, speaker_uuid: Optional[str], temp_id: str, context_mode: str) -> None:
-        state = self.load(speaker_uuid, temp_id)
-        state.context_mode = context_mode
-        self.save(state, speaker_uuid, temp_id)
+        key = self._key(speaker_uuid, temp_id)
+        try:
+            self._touch(key, context_mode)
+        except ResponseError:
+            self._migrate_legacy(key)
+            self._touch(key, context_mode)
+
+    def _touch(self, key: str, context_mode: str) -> None:
+        with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"context_mode": context_mode, "last_seen_ts": str(time.time())})
+            pipe.expire(key, self._ttl)
+            pipe.execute()
+
+    def _migrate_legacy(self, key: str) -> Dict[str, str]:
+        """Rewrite a JSON-string session from an older release as a hash and return its fields."""
+
+        raw = self._redis.get(key)
+        try:
+            legacy = json.loads(raw) if raw else {}
+        except ValueError:
+            legacy = {}
+        if not isinstance(legacy, dict):
+            legacy = {}
+        known = {name: legacy[name] for name in _FIELD_NAMES if name in legacy}
+        data = {name: "" if value is None else str(value) for name, value in known.items()}
+        with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if data:
+                pipe.hset(key, mapping=data)
+                pipe.expire(key, self._ttl)
+            pipe.execute()
+        return data
 
     def clear(self, speaker_uuid: Optional[str], temp_id: str) -> None:
         key = self._key(speaker_uuid, temp_id)
@@ -70,3 +150,20 @@ class SessionStore:
         except AttributeError:
             # Not all redis clients expose delete (our in-repo stub does).
             pass
+
+    def _encode(self, state: SessionState) -> Dict[str, str]:
+        encoded: Dict[str, str] = {}
+        for name in _FIELD_NAMES:
+            value = getattr(state, name)
+            encoded[name] = "" if value is None else str(value)
+        return encoded
+
+    def _decode(self, data: Dict[str, str], speaker_uuid: Optional[str]) -> SessionState:
+        if not data:
+            return SessionState(speaker_uuid=speaker_uuid, last_seen_ts=time.time())
+        state = SessionState(*[
+            decode(data[name]) if name in data else default for name, decode, default in _FIELD_DECODERS
+        ])
+        if "speaker_uuid" not in data:
+            state.speaker_uuid = speaker_uuid
+        return state
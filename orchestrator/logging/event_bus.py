@@ -2,14 +2,65 @@
 from __future__ import annotations
 
 import json
+import queue
+import threading
 import time
-from typing import Any, Dict, Optional
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import paho.mqtt.client as mqtt
 
+try:  # pragma: no cover - optional accelerated codec
+    import orjson
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+_Event = Tuple[str, Any]
+_QueueItem = Union[_Event, List[_Event], threading.Event]
+
+
+class _SharedClient:
+    """One paho client (socket + network thread) per broker identity."""
+
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str]) -> None:
+        self.host = host
+        self.port = port
+        self.client = mqtt.Client(client_id="halcyon-eventbus", clean_session=True)
+        if username and password:
+            self.client.username_pw_set(username, password)
+        self.client.max_inflight_messages_set(200)
+        self.client.max_queued_messages_set(10_000)
+        self.connected = False
+        self.retry_at = 0.0
+        self.lock = threading.Lock()
+
+
+_SHARED_CLIENTS: Dict[Tuple[str, int, Optional[str]], _SharedClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(host: str, port: int, username: Optional[str], password: Optional[str]) -> _SharedClient:
+    key = (host, port, username)
+    with _SHARED_CLIENTS_LOCK:
+        shared = _SHARED_CLIENTS.get(key)
+        if shared is None:
+            shared = _SHARED_CLIENTS[key] = _SharedClient(host, port, username, password)
+        return shared
+
 
 class EventBus:
-    """Publishes orchestrator telemetry to MQTT diagnostic topics."""
+    """Publishes orchestrator telemetry to MQTT diagnostic topics.
+
+    ``publish`` only enqueues; a daemon thread drains the queue in short
+    batches so serialization and socket writes stay off the caller's path.
+    The broker connection is opened lazily by that thread and shared by every
+    bus pointed at the same host, port, and user.
+    """
+
+    BATCH_WINDOW_SEC = 0.02
+    BATCH_MAX = 64
+    TOPIC_CACHE_MAX = 256
+    RECONNECT_INTERVAL_SEC = 5.0
 
     def __init__(
         self,
@@ -20,18 +71,151 @@ class EventBus:
         base_topic: str = "halcyon",
     ) -> None:
         self._base_topic = base_topic.rstrip("/")
-        self._client = mqtt.Client(client_id="halcyon-eventbus", clean_session=True)
-        if username and password:
-            self._client.username_pw_set(username, password)
-        self._client.connect(host, port, keepalive=25)
-        self._client.loop_start()
+        self._topic_cache: Dict[str, str] = {}
+        self._shared = _shared_client(host, port, username, password)
+        self._client = self._shared.client
+        self._queue: "queue.SimpleQueue[_QueueItem]" = queue.SimpleQueue()
+        self._dropped = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._drain, name="halcyon-eventbus", daemon=True)
+        self._thread.start()
 
     def publish(self, topic_suffix: str, payload: Dict[str, Any]) -> None:
-        topic = f"{self._base_topic}/{topic_suffix.lstrip('/')}"
-        message = payload.copy()
-        message.setdefault("ts", time.time())
+        """Enqueue ``payload`` for ``topic_suffix``.
+
+        A payload without ``ts`` is copied while stamping, so the caller may
+        reuse it afterwards; one that already carries ``ts`` is queued as-is
+        and must not be mutated until it has been flushed.
+        """
+
+        # Only stamped payloads need a new dict; the caller's mapping is never mutated.
+        if "ts" not in payload:
+            payload = {**payload, "ts": time.time()}
+        self._queue.put_nowait((self._topic(topic_suffix), payload))
+
+    def publish_struct(self, topic_suffix: str, event: Any) -> None:
+        """Enqueue a dataclass event that already carries its own ``ts`` field.
+
+        The instance is serialized directly by the flusher, so no payload dict
+        is built on the caller's path.
+        """
+
+        self._queue.put_nowait((self._topic(topic_suffix), event))
+
+    def publish_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Enqueue related events as one unit sharing a single timestamp.
+
+        Payloads are copied or retained exactly as in :meth:`publish`.
+        """
+
+        ts = time.time()
+        batch = [
+            (self._topic(suffix), payload if "ts" in payload else {**payload, "ts": ts})
+            for suffix, payload in events
+        ]
+        if batch:
+            self._queue.put_nowait(batch)
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded because the broker was unreachable or paho's queue was full."""
+
+        return self._dropped
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until events queued before this call are handed to MQTT."""
+
+        done = threading.Event()
+        self._queue.put_nowait(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 2.0) -> None:
+        """Send everything queued so far, then stop the drain thread.
+
+        The broker connection is shared with other buses and stays open.
+        Events published after ``close`` are never sent.
+        """
+
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        # The stop event doubles as the final queue marker: FIFO order means
+        # every earlier event is handled before the drain thread sees it.
+        self._queue.put_nowait(self._stop)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    def _topic(self, suffix: str) -> str:
+        topic = self._topic_cache.get(suffix)
+        if topic is None:
+            if len(self._topic_cache) >= self.TOPIC_CACHE_MAX:
+                self._topic_cache.clear()
+            topic = self._topic_cache[suffix] = f"{self._base_topic}/{suffix.lstrip('/')}"
+        return topic
+
+    def _ensure_connected(self) -> None:
+        shared = self._shared
+        if shared.connected:
+            return
+        with shared.lock:
+            if shared.connected:
+                return
+            now = time.monotonic()
+            if now < shared.retry_at:
+                raise ConnectionError("MQTT broker unreachable; waiting to reconnect")
+            try:
+                shared.client.connect(shared.host, shared.port, keepalive=25)
+                shared.client.loop_start()
+            except Exception:
+                shared.retry_at = now + self.RECONNECT_INTERVAL_SEC
+                raise
+            shared.connected = True
+
+    def _drain(self) -> None:
+        while True:
+            batch: List[_QueueItem] = [self._queue.get()]
+            deadline = time.monotonic() + self.BATCH_WINDOW_SEC
+            while len(batch) < self.BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._ensure_connected()
+                connected = True
+            except Exception:
+                # Broker unreachable: count this batch as dropped; the connect is
+                # retried once RECONNECT_INTERVAL_SEC has passed.
+                connected = False
+            stopping = False
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    stopping = stopping or item is self._stop
+                    item.set()
+                elif not connected:
+                    self._dropped += len(item) if isinstance(item, list) else 1
+                elif isinstance(item, list):
+                    for event in item:
+                        self._send(*event)
+                else:
+                    self._send(*item)
+            if stopping:
+                return
+
+    def _send(self, topic: str, message: Any) -> None:
         try:
-            self._client.publish(topic, json.dumps(message), qos=0, retain=False)
+            if orjson is not None:
+                data = orjson.dumps(message)  # serializes dataclasses natively
+            else:
+                data = json.dumps(asdict(message) if is_dataclass(message) else message)
+            info = self._client.publish(topic, data, qos=0, retain=False)
         except Exception:
             # Diagnostics should never break the core loop; failures are dropped.
-            pass
+            self._dropped += 1
+            return
+        if getattr(info, "rc", mqtt.MQTT_ERR_SUCCESS) == mqtt.MQTT_ERR_QUEUE_SIZE:
+            self._dropped += 1
@@ -8,11 +8,10 @@ self-healing de-escalation heuristics.
 from __future__ import annotations
 
 from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
-from time import monotonic
-from typing import Deque, Dict, Iterable, Optional
-
-from pydantic import BaseModel, Field, NonNegativeFloat, PositiveInt, validator
+from time import monotonic, monotonic_ns
+from typing import Deque, Iterable, Optional
 
 
 class PersonaState(str, Enum):
@@ -22,76 +21,79 @@ class PersonaState(str, Enum):
     SCARLET = "scarlet"
 
 
-class ThreatSignal(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ThreatSignal:
     """Normalized representation of a threat detection signal.
 
     Severity scores are expected to be in the range [0, 1]. The state machine
     uses the score to accumulate evidence for escalation. The source and
-    description fields provide auditability for later review.
+    description fields provide auditability for later review. Signals are
+    built by trusted runtime code, so only cheap range checks are applied.
     """
 
-    severity: NonNegativeFloat = Field(..., le=1.0)
-    source: str = Field(..., min_length=1)
-    description: str = Field(default="", max_length=512)
-    timestamp: float = Field(default_factory=monotonic)
+    severity: float
+    source: str
+    description: str = ""
+    timestamp: float = field(default_factory=monotonic)
 
-    @validator("description")
-    def _trim_description(cls, value: str) -> str:  # pragma: no cover - defensive
-        return value.strip()
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.severity <= 1.0:
+            raise ValueError("severity must be within [0, 1]")
+        if not self.source:
+            raise ValueError("source must not be empty")
+        if self.description:
+            object.__setattr__(self, "description", self.description.strip()[:512])
 
 
-class ReassuranceSignal(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ReassuranceSignal:
     """Indicates an explicit human acknowledgement that the situation is safe."""
 
-    confidence: NonNegativeFloat = Field(..., le=1.0)
-    source: str = Field(..., min_length=1)
-    timestamp: float = Field(default_factory=monotonic)
-
-
-class ModeSwitchConfig(BaseModel):
-    """Tunable parameters for the persona state machine."""
-
-    escalate_threshold: float = Field(
-        default=0.6,
-        ge=0.0,
-        le=1.0,
-        description="Threat severity required to consider escalation.",
-    )
-    deescalate_threshold: float = Field(
-        default=0.25,
-        ge=0.0,
-        le=1.0,
-        description="Cumulative threat score below which de-escalation is allowed.",
-    )
-    sustained_escalation_count: PositiveInt = Field(
-        default=2,
-        description=(
-            "Number of consecutive high severity signals required before switching "
-            "to SCARLET."
-        ),
-    )
-    sustained_reassurance_count: PositiveInt = Field(
-        default=3,
-        description=(
-            "Number of consecutive reassurance signals required before returning to "
-            "HALSTON."
-        ),
-    )
-    lookback_window: PositiveInt = Field(
-        default=10,
-        description="Number of recent signals kept for rolling computation.",
-    )
-    cooldown_seconds: NonNegativeFloat = Field(
-        default=30.0,
-        description="Minimum time required between persona switches.",
-    )
-
-    @validator("deescalate_threshold")
-    def _check_deescalate_threshold(cls, value: float, values: Dict[str, float]) -> float:
-        escalate_threshold = values.get("escalate_threshold", 0.6)
-        if value > escalate_threshold:
+    confidence: float
+    source: str
+    timestamp: float = field(default_factory=monotonic)
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError("confidence must be within [0, 1]")
+        if not self.source:
+            raise ValueError("source must not be empty")
+
+
+@dataclass(slots=True, frozen=True)
+class ModeSwitchConfig:
+    """Tunable parameters for the persona state machine.
+
+    Attributes:
+        escalate_threshold: Threat severity required to consider escalation.
+        deescalate_threshold: Cumulative threat score below which de-escalation
+            is allowed; must not exceed ``escalate_threshold``.
+        sustained_escalation_count: Number of consecutive high severity signals
+            required before switching to SCARLET.
+        sustained_reassurance_count: Number of consecutive reassurance signals
+            required before returning to HALSTON.
+        lookback_window: Number of recent signals kept for rolling computation.
+        cooldown_seconds: Minimum time required between persona switches.
+    """
+
+    escalate_threshold: float = 0.6
+    deescalate_threshold: float = 0.25
+    sustained_escalation_count: int = 2
+    sustained_reassurance_count: int = 3
+    lookback_window: int = 10
+    cooldown_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        for name in ("escalate_threshold", "deescalate_threshold"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be within [0, 1]")
+        for name in ("sustained_escalation_count", "sustained_reassurance_count", "lookback_window"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be a positive integer")
+        if self.cooldown_seconds < 0.0:
+            raise ValueError("cooldown_seconds must be non-negative")
+        if self.deescalate_threshold > self.escalate_threshold:
             raise ValueError("De-escalate threshold must not exceed escalate threshold.")
-        return value
 
 
 class PersonaStateMachine:
@@ -109,12 +111,23 @@ class PersonaStateMachine:
         state: PersonaState = PersonaState.HALSTON,
     ) -> None:
         self.config = config or ModeSwitchConfig()
+        # The config is frozen, so hot thresholds can be copied onto the instance.
+        self._escalate_threshold = self.config.escalate_threshold
+        self._deescalate_threshold = self.config.deescalate_threshold
+        self._escalation_count = self.config.sustained_escalation_count
+        # Switch times are integer nanoseconds so the cooldown check is an int compare.
+        self._cooldown_ns = int(self.config.cooldown_seconds * 1_000_000_000)
         self._state: PersonaState = state
         self._threat_signals: Deque[ThreatSignal] = deque(maxlen=self.config.lookback_window)
         self._reassurance_signals: Deque[ReassuranceSignal] = deque(
             maxlen=self.config.lookback_window
         )
-        self._last_switch_time: float = monotonic()
+        # Running aggregates so evaluation never rescans the signal windows.
+        self._threat_sum = 0.0
+        self._high_severity_streak = 0
+        self._recent_confidence: Deque[float] = deque(maxlen=self.config.sustained_reassurance_count)
+        self._recent_confidence_sum = 0.0
+        self._last_switch_ns: int = monotonic_ns()
         self._manual_override: Optional[PersonaState] = None
 
     @property
@@ -133,18 +146,18 @@ class PersonaStateMachine:
         self._manual_override = persona
         if persona is not None:
             self._state = persona
-            self._last_switch_time = monotonic()
+            self._last_switch_ns = monotonic_ns()
 
     def register_threat(self, signal: ThreatSignal) -> PersonaState:
         """Register a new threat signal and evaluate state transitions."""
 
-        self._threat_signals.append(signal)
+        self._push_threat(signal)
         return self._evaluate_state()
 
     def register_reassurance(self, signal: ReassuranceSignal) -> PersonaState:
         """Register a reassurance signal from a trusted operator."""
 
-        self._reassurance_signals.append(signal)
+        self._push_reassurance(signal)
         return self._evaluate_state()
 
     def consume_bulk_signals(
@@ -152,54 +165,90 @@ class PersonaStateMachine:
     ) -> PersonaState:
         """Consume a batch of signals prior to evaluating state transitions."""
 
-        for threat in threats:
-            self._threat_signals.append(threat)
-        for reassurance in reassurances:
-            self._reassurance_signals.append(reassurance)
+        self._threat_signals.extend(threats)
+        self._reassurance_signals.extend(reassurances)
+        self._rebuild_aggregates()
         return self._evaluate_state()
 
     # Internal helpers -------------------------------------------------
 
+    def _push_threat(self, signal: ThreatSignal) -> None:
+        signals = self._threat_signals
+        if len(signals) == signals.maxlen:
+            self._threat_sum -= signals[0].severity
+        signals.append(signal)
+        self._threat_sum += signal.severity
+        if signal.severity >= self._escalate_threshold:
+            self._high_severity_streak += 1
+        else:
+            self._high_severity_streak = 0
+
+    def _push_reassurance(self, signal: ReassuranceSignal) -> None:
+        self._reassurance_signals.append(signal)
+        recent = self._recent_confidence
+        if len(recent) == recent.maxlen:
+            self._recent_confidence_sum -= recent[0]
+        recent.append(signal.confidence)
+        self._recent_confidence_sum += signal.confidence
+
+    def _rebuild_aggregates(self) -> None:
+        """Recompute the running aggregates from the windows in one pass each."""
+
+        threshold = self._escalate_threshold
+        self._threat_sum = sum(sig.severity for sig in self._threat_signals)
+        streak = 0
+        for sig in reversed(self._threat_signals):
+            if sig.severity < threshold:
+                break
+            streak += 1
+        self._high_severity_streak = streak
+        self._recent_confidence.clear()
+        self._recent_confidence.extend(sig.confidence for sig in self._reassurance_signals)
+        self._recent_confidence_sum = sum(self._recent_confidence)
+
+    def _clear_threats(self) -> None:
+        self._threat_signals.clear()
+        self._threat_sum = 0.0
+        self._high_severity_streak = 0
+
+    def _clear_reassurances(self) -> None:
+        self._reassurance_signals.clear()
+        self._recent_confidence.clear()
+        self._recent_confidence_sum = 0.0
+
     def _evaluate_state(self) -> PersonaState:
         if self._manual_override is not None:
             return self._manual_override
 
-        now = monotonic()
-        if now - self._last_switch_time < self.config.cooldown_seconds:
+        now_ns = monotonic_ns()
+        if now_ns - self._last_switch_ns < self._cooldown_ns:
             # Within cooldown period; do not allow automatic switching but keep
             # collecting evidence for later.
             return self._state
 
         if self._should_escalate():
             self._state = PersonaState.SCARLET
-            self._last_switch_time = now
-            self._reassurance_signals.clear()
+            self._last_switch_ns = now_ns
+            self._clear_reassurances()
         elif self._should_deescalate():
             self._state = PersonaState.HALSTON
-            self._last_switch_time = now
-            self._threat_signals.clear()
+            self._last_switch_ns = now_ns
+            self._clear_threats()
         return self._state
 
     def _should_escalate(self) -> bool:
-        if len(self._threat_signals) < self.config.sustained_escalation_count:
-            return False
-        recent = list(self._threat_signals)[-self.config.sustained_escalation_count :]
-        high_severity = [sig for sig in recent if sig.severity >= self.config.escalate_threshold]
-        if len(high_severity) < self.config.sustained_escalation_count:
-            return False
-        aggregate = sum(sig.severity for sig in recent) / len(recent)
-        return aggregate >= self.config.escalate_threshold
+        # A full run of high-severity signals implies their mean clears the
+        # threshold too, so the trailing streak length is the whole test.
+        required = self._escalation_count
+        return len(self._threat_signals) >= required and self._high_severity_streak >= required
 
     def _should_deescalate(self) -> bool:
-        if len(self._reassurance_signals) < self.config.sustained_reassurance_count:
+        recent = self._recent_confidence
+        if len(self._reassurance_signals) < recent.maxlen:
             return False
-        recent = list(self._reassurance_signals)[-self.config.sustained_reassurance_count :]
-        avg_confidence = sum(sig.confidence for sig in recent) / len(recent)
-        if avg_confidence < self.config.deescalate_threshold:
+        if self._recent_confidence_sum / len(recent) < self._deescalate_threshold:
             return False
         if not self._threat_signals:
             return True
-        cumulative_threat = sum(sig.severity for sig in self._threat_signals) / len(
-            self._threat_signals
-        )
-        return cumulative_threat <= self.config.deescalate_threshold
+        cumulative_threat = self._threat_sum / len(self._threat_signals)
+        return cumulative_threat <= self._deescalate_threshold
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 from ha_adapter.intents.intent_router import IntentContext, IntentResult, IntentRouter
 from ha_adapter.intents.intent_media import MediaIntentHandler
@@ -23,8 +23,23 @@ from orchestrator.routing.message_router import IntentClassification, MessageRou
 from scarlet.escalation_protocols.scarlet_agent import ScarletAgent
 from speakerid.identity_resolver import IdentityResolver
 
+if TYPE_CHECKING:  # pragma: no cover - the voice pipeline imports this module
+    from services.voice_pipeline.tts_engine import TTSEngine
+
 Logger = logging.getLogger(__name__)
 
+_VALID_ROLES = frozenset({"owner", "household", "guest", "unknown"})
+
+
+def _routing_errors() -> Tuple[type, ...]:
+    """Exception types a failed speech routing attempt may raise."""
+
+    try:  # redis is optional; only the voice pipeline needs it
+        from redis.exceptions import RedisError
+    except Exception:  # pragma: no cover - optional dependency
+        return (RuntimeError, OSError)
+    return (RuntimeError, OSError, RedisError)
+
 
 @dataclass
 class OrchestratorDependencies:
@@ -59,6 +74,7 @@ class Orchestrator:
         self._scarlet = deps.scarlet_agent
         self.sessions = session_store or SessionStore(redis_url="redis://localhost:6379/0")
         self.events = event_bus or EventBus()
+        self._tts: Optional[TTSEngine] = None
         if deps.media_handler is not None and getattr(self._intent_router, "_media", None) is None:
             self._intent_router._media = deps.media_handler  # type: ignore[attr-defined]
 
@@ -106,7 +122,9 @@ class Orchestrator:
             now_ts=now,
         )
         decision = self._trust_scorer.score(inputs, identity_role_hint=self._normalize_role(role_hint))
-        persona = self._select_persona(session, decision)
+        # Turn telemetry is collected here and handed to the bus once at the end.
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        persona = self._select_persona(session, decision, events)
 
         classification = self._message_router.classify(user_text, decision.role)
         intent_result: Optional[IntentResult] = None
@@ -136,6 +154,7 @@ class Orchestrator:
         self.sessions.save(session, stable_uuid, speaker_temp_id)
 
         self._publish_events(
+            events,
             session=session,
             decision=decision,
             classification=classification,
@@ -152,31 +171,39 @@ class Orchestrator:
 
                 # Check if speech is allowed
                 if conversation_router.can_speak_in(room_id, persona.name):
-                    # Generate TTS audio
-                    from services.voice_pipeline.tts_engine import TTSEngine
-
-                    tts = TTSEngine()
-                    audio = tts.synth(persona=persona.name, text=response)
-
-                    # Route via output router
+                    audio = self._tts_engine().synth(persona=persona.name, text=response)
                     output_router.route(persona.name, stable_uuid, room_id, audio)
 
                 # Update last room and publish active room event
                 conversation_router.update_last_room(stable_uuid, room_id)
-            except Exception:
-                # Routing failures should not break the orchestrator
+            except _routing_errors():
+                # Room lookup, TTS setup, Redis and transport failures should not
+                # break the turn; anything else is a bug and propagates.
                 Logger.exception("Failed to route TTS output")
 
         persona_label = persona.name
         return response, persona_label
 
     # ------------------------------------------------------------------
+    def _tts_engine(self) -> TTSEngine:
+        """Return the shared TTS engine, constructing it on first spoken turn."""
+
+        if self._tts is None:
+            # Imported here: the voice pipeline package imports the orchestrator.
+            from services.voice_pipeline.tts_engine import TTSEngine
+
+            self._tts = TTSEngine()
+        return self._tts
+
     def _normalize_role(self, hint: Optional[str]) -> Optional[Role]:
-        if hint in {"owner", "household", "guest", "unknown"}:
-            return cast(Role, hint)
-        return None
+        return cast(Role, hint) if hint in _VALID_ROLES else None
 
-    def _select_persona(self, session: SessionState, decision: TrustDecision) -> PersonaState:
+    def _select_persona(
+        self,
+        session: SessionState,
+        decision: TrustDecision,
+        events: List[Tuple[str, Dict[str, Any]]],
+    ) -> PersonaState:
         persona = self._state_machine.state
         source = "state_machine"
         if decision.persona_bias == "SCARLET":
@@ -196,14 +223,16 @@ class Orchestrator:
                 ReassuranceSignal(confidence=0.6, source="sensitivity_guard"),
             )
             source = "sensitivity_guard"
-        self.events.publish(
-            "orch/active_persona",
-            {
-                "persona": persona.value,
-                "source": source,
-                "conversation_turn": session.conversation_turn,
-                "speaker_uuid": session.speaker_uuid,
-            },
+        events.append(
+            (
+                "orch/active_persona",
+                {
+                    "persona": persona.value,
+                    "source": source,
+                    "conversation_turn": session.conversation_turn,
+                    "speaker_uuid": session.speaker_uuid,
+                },
+            )
         )
         return persona
 
@@ -221,7 +250,7 @@ class Orchestrator:
             mode=session.context_mode,
             speaker_uuid=session.speaker_uuid,
             session_id=speaker_temp_id,
-            persona=persona.value,
+            persona=persona.name,
         )
         try:
             return self._intent_router.handle(classification.intent or "", classification.slots, context)
@@ -239,31 +268,33 @@ class Orchestrator:
         intent_result: Optional[IntentResult],
     ) -> str:
         agent = self._halston if persona is PersonaState.HALSTON else self._scarlet
-        summary = {
-            "speaker_uuid": session.speaker_uuid,
-            "context_mode": session.context_mode,
-            "conversation_turn": session.conversation_turn,
-            "last_trust": session.last_trust,
-        }
+        if intent_result is not None and not intent_result.ok:
+            # Denials never consult the metadata, so skip building it.
+            denial_reason = intent_result.spoken or "The request could not be completed."
+            denial = AccessDecision(allowed=False, reason=denial_reason, required_trust=None, speaker_trust=None)
+            return agent.build_denied_response(denial)
+
+        # A fresh dict per turn: SCARLET keeps metadata in its incident records.
         metadata: Dict[str, object] = {
-            "session": summary,
+            "session": {
+                "speaker_uuid": session.speaker_uuid,
+                "context_mode": session.context_mode,
+                "conversation_turn": session.conversation_turn,
+                "last_trust": session.last_trust,
+            },
             "slots": classification.slots,
             "intent_confidence": classification.confidence,
         }
-        if intent_result is not None:
-            metadata["intent_result"] = intent_result.dict()
         if intent_result is None:
             return agent.generate_response(user_text, intent=None, metadata=metadata)
-        if intent_result.ok:
-            response = agent.generate_response(user_text, intent=classification.intent, metadata=metadata)
-            spoken = intent_result.spoken.strip()
-            return f"{response} {spoken}".strip()
-        denial_reason = intent_result.spoken or "The request could not be completed."
-        denial = AccessDecision(allowed=False, reason=denial_reason, required_trust=None, speaker_trust=None)
-        return agent.build_denied_response(denial)
+        metadata["intent_result"] = intent_result.to_dict()
+        response = agent.generate_response(user_text, intent=classification.intent, metadata=metadata)
+        spoken = intent_result.spoken.strip()
+        return f"{response} {spoken}".strip()
 
     def _publish_events(
         self,
+        events: List[Tuple[str, Dict[str, Any]]],
         *,
         session: SessionState,
         decision: TrustDecision,
@@ -272,24 +303,29 @@ class Orchestrator:
         persona: PersonaState,
         user_text: str,
     ) -> None:
-        self.events.publish(
-            "orch/trust",
-            {
-                "score": round(decision.score, 2),
-                "role": decision.role,
-                "allow_sensitive": decision.allow_sensitive,
-                "persona_bias": decision.persona_bias,
-                "speaker_uuid": session.speaker_uuid,
-            },
+        events.append(
+            (
+                "orch/trust",
+                {
+                    "score": round(decision.score, 2),
+                    "role": decision.role,
+                    "allow_sensitive": decision.allow_sensitive,
+                    "persona_bias": decision.persona_bias,
+                    "speaker_uuid": session.speaker_uuid,
+                },
+            )
         )
-        self.events.publish(
-            "orch/intent",
-            {
-                "intent": classification.intent,
-                "slots": classification.slots,
-                "success": success if classification.intent else None,
-                "persona": persona.value,
-                "excerpt": user_text[:160],
-                "speaker_uuid": session.speaker_uuid,
-            },
+        events.append(
+            (
+                "orch/intent",
+                {
+                    "intent": classification.intent,
+                    "slots": classification.slots,
+                    "success": success if classification.intent else None,
+                    "persona": persona.value,
+                    "excerpt": user_text[:160],
+                    "speaker_uuid": session.speaker_uuid,
+                },
+            )
         )
+        self.events.publish_many(events)
@@ -1,7 +1,9 @@
 """Trust-gated access control for HALCYON intents."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -16,7 +18,8 @@ class TrustLevel(int, Enum):
     ADMIN = 3
 
 
-class AccessDecision(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AccessDecision:
     """Represents the result of an access control evaluation."""
 
     allowed: bool
@@ -25,6 +28,18 @@ class AccessDecision(BaseModel):
     speaker_trust: TrustLevel | None = None
 
 
+@lru_cache(maxsize=None)
+def _decision(
+    allowed: bool,
+    reason: Optional[str],
+    required_trust: TrustLevel | None,
+    speaker_trust: TrustLevel | None,
+) -> AccessDecision:
+    # Every argument comes from a small fixed vocabulary (fixed reasons, trust
+    # levels), so each distinct decision is built once and shared.
+    return AccessDecision(allowed, reason, required_trust, speaker_trust)
+
+
 class IntentPolicy(BaseModel):
     """Policy metadata describing the requirements for an intent."""
 
@@ -83,37 +98,21 @@ class AccessController:
 
         if request.speaker_id is None and not policy.allow_unrecognized:
             if request.confidence < 0.85:
-                return AccessDecision(
-                    allowed=False,
-                    reason="Unidentified speaker with insufficient confidence.",
-                    required_trust=policy.minimum_trust,
-                    speaker_trust=None,
+                return _decision(
+                    False, "Unidentified speaker with insufficient confidence.", policy.minimum_trust, None
                 )
 
         if speaker_profile is None:
             if policy.allow_unrecognized and request.confidence >= 0.85:
-                return AccessDecision(allowed=True, speaker_trust=None, required_trust=policy.minimum_trust)
-            return AccessDecision(
-                allowed=False,
-                reason="Speaker not recognized.",
-                required_trust=policy.minimum_trust,
-                speaker_trust=None,
-            )
+                return _decision(True, None, policy.minimum_trust, None)
+            return _decision(False, "Speaker not recognized.", policy.minimum_trust, None)
 
         if speaker_trust < policy.minimum_trust:
-            return AccessDecision(
-                allowed=False,
-                reason="Insufficient trust level.",
-                required_trust=policy.minimum_trust,
-                speaker_trust=speaker_trust,
-            )
+            return _decision(False, "Insufficient trust level.", policy.minimum_trust, speaker_trust)
 
         if not speaker_profile.is_verified and policy.minimum_trust >= TrustLevel.ADMIN:
-            return AccessDecision(
-                allowed=False,
-                reason="Administrative actions require verified identity.",
-                required_trust=policy.minimum_trust,
-                speaker_trust=speaker_trust,
+            return _decision(
+                False, "Administrative actions require verified identity.", policy.minimum_trust, speaker_trust
             )
 
-        return AccessDecision(allowed=True, speaker_trust=speaker_trust, required_trust=policy.minimum_trust)
+        return _decision(True, None, policy.minimum_trust, speaker_trust)
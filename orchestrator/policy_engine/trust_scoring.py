@@ -3,11 +3,88 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
 import time
 
+try:  # pragma: no cover - optional vectorized batch scoring
+    import numpy as np
+except Exception:  # pragma: no cover - batch scoring falls back to per-input calls
+    np = None  # type: ignore
+
+try:  # pragma: no cover - optional JIT for the scoring kernel
+    from numba import njit
+except Exception:  # pragma: no cover - run the kernel as plain Python
+    njit = None  # type: ignore
+
 
 Role = Literal["owner", "household", "guest", "unknown"]
+PersonaBias = Literal["HALSTON", "SCARLET", "neutral"]
+
+# Small-int encodings used at the kernel boundary.
+_CTX_HOME, _CTX_MAINTENANCE, _CTX_NIGHT, _CTX_AWAY, _CTX_INCIDENT, _CTX_OTHER = range(6)
+_CTX_CODES: Dict[str, int] = {
+    "home": _CTX_HOME,
+    "maintenance": _CTX_MAINTENANCE,
+    "night": _CTX_NIGHT,
+    "away": _CTX_AWAY,
+    "incident": _CTX_INCIDENT,
+}
+_ROLE_OWNER, _ROLE_HOUSEHOLD, _ROLE_GUEST = range(3)
+_ROLES: Tuple[Role, ...] = ("owner", "household", "guest")
+_BIAS_NEUTRAL, _BIAS_HALSTON, _BIAS_SCARLET = range(3)
+_BIASES: Tuple[PersonaBias, ...] = ("neutral", "HALSTON", "SCARLET")
+
+
+def _score_kernel(
+    voice: float,
+    face: float,
+    prior: float,
+    reassurance: float,
+    threat: float,
+    dt: float,
+    penalty: float,
+    ctx_code: int,
+    owner_hint: bool,
+    base_guest: float,
+    owner_thresh: float,
+    household_thresh: float,
+    cooldown: float,
+    band: float,
+) -> Tuple[float, int, bool, int, float]:
+    """Primitive-only scoring arithmetic; returns (score, role, allow_sensitive, bias, id_strength)."""
+
+    id_strength = max(voice, face) * 100.0
+    s = id_strength if id_strength > base_guest else base_guest
+    s -= penalty
+    s += 20.0 if reassurance > 20.0 else -20.0 if reassurance < -20.0 else reassurance
+    s -= 30.0 if threat > 30.0 else 0.0 if threat < 0.0 else threat
+
+    if dt < cooldown and abs(s - prior) < band:
+        s = prior
+    s = 100.0 if s > 100.0 else 0.0 if s < 0.0 else s
+
+    if s >= owner_thresh:
+        role = _ROLE_OWNER if owner_hint else _ROLE_HOUSEHOLD
+    elif s >= household_thresh:
+        role = _ROLE_HOUSEHOLD
+    else:
+        role = _ROLE_GUEST
+
+    trusted = role != _ROLE_GUEST
+    allow_sensitive = trusted and (ctx_code == _CTX_HOME or ctx_code == _CTX_MAINTENANCE)
+    if ctx_code == _CTX_NIGHT and role == _ROLE_OWNER and voice >= 0.80:
+        allow_sensitive = True
+
+    bias = _BIAS_NEUTRAL
+    if threat >= 15.0 or ctx_code == _CTX_AWAY or ctx_code == _CTX_INCIDENT:
+        bias = _BIAS_SCARLET
+    elif trusted and threat <= 5.0:
+        bias = _BIAS_HALSTON
+    return s, role, allow_sensitive, bias, id_strength
+
+
+if njit is not None:  # pragma: no cover - depends on numba being installed
+    _score_kernel = njit(cache=True)(_score_kernel)
 
 
 @dataclass(frozen=True)
@@ -25,15 +102,29 @@ class TrustInputs:
     now_ts: float = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustDecision:
-    """Outcome from trust scoring including persona bias and access hints."""
+    """Outcome from trust scoring including persona bias and access hints.
+
+    The scoring inputs are kept as raw numbers; ``notes`` formats them only
+    when something actually reads it.
+    """
 
     score: float
     role: Role
     allow_sensitive: bool
-    persona_bias: Literal["HALSTON", "SCARLET", "neutral"]
-    notes: str
+    persona_bias: PersonaBias
+    id_strength: float = 0.0
+    context_mode: str = "home"
+    threat: float = 0.0
+    reassurance: float = 0.0
+
+    @property
+    def notes(self) -> str:
+        return (
+            f"id_strength={self.id_strength:.1f}, ctx={self.context_mode}, "
+            f"threat={self.threat:.1f}, reassure={self.reassurance:.1f}"
+        )
 
 
 class TrustScorer:
@@ -45,6 +136,7 @@ class TrustScorer:
     GUEST_MAX = 35.0
     COOLDOWN_SEC = 20.0
     HYSTERESIS_BAND = 6.0
+    BATCH_MIN = 8  # below this, array setup costs more than the scalar kernel
 
     CONTEXT_PENALTIES: Dict[str, float] = {
         "home": 0.0,
@@ -58,51 +150,100 @@ class TrustScorer:
         """Calculate a trust decision from the current sensory and identity inputs."""
 
         voice = inp.voice_match or 0.0
-        face = inp.face_match or 0.0
-        id_strength = max(voice, face) * 100.0
-
-        s = max(self.BASE_GUEST, id_strength)
-        s -= self.CONTEXT_PENALTIES.get(inp.context_mode, 0.0)
-        s += max(-20.0, min(20.0, inp.reassurance))
-        s -= max(0.0, min(30.0, inp.threat))
-
-        dt = (inp.now_ts - inp.last_update_ts) if inp.last_update_ts else 9999
-        if dt < self.COOLDOWN_SEC and abs(s - inp.prior_score) < self.HYSTERESIS_BAND:
-            s = inp.prior_score
-
-        s = max(0.0, min(100.0, s))
-
-        role: Role = "unknown"
-        if s >= self.OWNER_THRESH:
-            role_hint = identity_role_hint or "household"
-            role = "owner" if role_hint == "owner" else "household"
-        elif s >= self.HOUSEHOLD_THRESH:
-            role = "household"
-        elif s <= self.GUEST_MAX:
-            role = "guest"
-        else:
-            role = "guest"
-
-        allow_sensitive = (
-            role in {"owner", "household"} and inp.context_mode in {"home", "maintenance"}
+        dt = (inp.now_ts - inp.last_update_ts) if inp.last_update_ts else 9999.0
+        s, role_code, allow_sensitive, bias_code, id_strength = _score_kernel(
+            voice,
+            inp.face_match or 0.0,
+            inp.prior_score,
+            inp.reassurance,
+            inp.threat,
+            dt,
+            self.CONTEXT_PENALTIES.get(inp.context_mode, 0.0),
+            _CTX_CODES.get(inp.context_mode, _CTX_OTHER),
+            identity_role_hint == "owner",
+            self.BASE_GUEST,
+            self.OWNER_THRESH,
+            self.HOUSEHOLD_THRESH,
+            self.COOLDOWN_SEC,
+            self.HYSTERESIS_BAND,
         )
-        if inp.context_mode == "night" and role == "owner" and voice >= 0.80:
-            allow_sensitive = True
-
-        persona_bias: Literal["HALSTON", "SCARLET", "neutral"] = "neutral"
-        if inp.threat >= 15.0 or inp.context_mode in {"away", "incident"}:
-            persona_bias = "SCARLET"
-        elif role in {"owner", "household"} and inp.threat <= 5.0:
-            persona_bias = "HALSTON"
 
         return TrustDecision(
             score=s,
-            role=role,
+            role=_ROLES[role_code],
             allow_sensitive=allow_sensitive,
-            persona_bias=persona_bias,
-            notes=(
-                f"id_strength={id_strength:.1f}, ctx={inp.context_mode}, "
-                f"threat={inp.threat:.1f}, reassure={inp.reassurance:.1f}"
-            ),
+            persona_bias=_BIASES[bias_code],
+            id_strength=id_strength,
+            context_mode=inp.context_mode,
+            threat=inp.threat,
+            reassurance=inp.reassurance,
+        )
+
+    def score_batch(
+        self,
+        inputs: Sequence[TrustInputs],
+        identity_role_hints: Optional[Sequence[Optional[Role]]] = None,
+    ) -> List[TrustDecision]:
+        """Score several speakers at once; results match calling :meth:`score` per input.
+
+        With NumPy available the arithmetic runs column-wise over all inputs;
+        otherwise each input goes through the scalar kernel.
+        """
+
+        hints = identity_role_hints if identity_role_hints is not None else [None] * len(inputs)
+        if np is None or len(inputs) < self.BATCH_MIN:
+            return [self.score(inp, hint) for inp, hint in zip(inputs, hints)]
+
+        n = len(inputs)
+        voice = np.fromiter((inp.voice_match or 0.0 for inp in inputs), dtype=np.float64, count=n)
+        face = np.fromiter((inp.face_match or 0.0 for inp in inputs), dtype=np.float64, count=n)
+        prior = np.fromiter((inp.prior_score for inp in inputs), dtype=np.float64, count=n)
+        reassurance = np.fromiter((inp.reassurance for inp in inputs), dtype=np.float64, count=n)
+        threat = np.fromiter((inp.threat for inp in inputs), dtype=np.float64, count=n)
+        last = np.fromiter((inp.last_update_ts for inp in inputs), dtype=np.float64, count=n)
+        now = np.fromiter((inp.now_ts for inp in inputs), dtype=np.float64, count=n)
+        penalty = np.fromiter(
+            (self.CONTEXT_PENALTIES.get(inp.context_mode, 0.0) for inp in inputs), dtype=np.float64, count=n
+        )
+        ctx = np.fromiter((_CTX_CODES.get(inp.context_mode, _CTX_OTHER) for inp in inputs), dtype=np.int8, count=n)
+        owner_hint = np.fromiter((hint == "owner" for hint in hints), dtype=bool, count=n)
+
+        id_strength = np.maximum(voice, face) * 100.0
+        s = np.maximum(id_strength, self.BASE_GUEST)
+        s = s - penalty
+        s = s + np.clip(reassurance, -20.0, 20.0)
+        s = s - np.clip(threat, 0.0, 30.0)
+        dt = np.where(last != 0.0, now - last, 9999.0)
+        s = np.where((dt < self.COOLDOWN_SEC) & (np.abs(s - prior) < self.HYSTERESIS_BAND), prior, s)
+        s = np.clip(s, 0.0, 100.0)
+
+        role = np.where(
+            s >= self.OWNER_THRESH,
+            np.where(owner_hint, _ROLE_OWNER, _ROLE_HOUSEHOLD),
+            np.where(s >= self.HOUSEHOLD_THRESH, _ROLE_HOUSEHOLD, _ROLE_GUEST),
+        )
+        trusted = role != _ROLE_GUEST
+        allow = (trusted & ((ctx == _CTX_HOME) | (ctx == _CTX_MAINTENANCE))) | (
+            (ctx == _CTX_NIGHT) & (role == _ROLE_OWNER) & (voice >= 0.80)
+        )
+        bias = np.where(
+            (threat >= 15.0) | (ctx == _CTX_AWAY) | (ctx == _CTX_INCIDENT),
+            _BIAS_SCARLET,
+            np.where(trusted & (threat <= 5.0), _BIAS_HALSTON, _BIAS_NEUTRAL),
         )
 
+        return [
+            TrustDecision(
+                score=score,
+                role=_ROLES[role_code],
+                allow_sensitive=allowed,
+                persona_bias=_BIASES[bias_code],
+                id_strength=strength,
+                context_mode=inp.context_mode,
+                threat=inp.threat,
+                reassurance=inp.reassurance,
+            )
+            for inp, score, role_code, allowed, bias_code, strength in zip(
+                inputs, s.tolist(), role.tolist(), allow.tolist(), bias.tolist(), id_strength.tolist()
+            )
+        ]
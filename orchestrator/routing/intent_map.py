@@ -4,6 +4,11 @@ from __future__ import annotations
 import re
 from typing import Dict, Optional, Tuple
 
+try:  # pragma: no cover - optional multi-pattern matcher
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - fall back to substring checks
+    ahocorasick = None  # type: ignore
+
 MEDIA_RECOMMEND_KEYWORDS = (
     "what should i watch",
     "recommend something",
@@ -12,47 +17,89 @@ MEDIA_RECOMMEND_KEYWORDS = (
     "recommend a movie",
 )
 
-MEDIA_REQUEST_PATTERNS = (
-    re.compile(r"add (?:number\s*)?(?P<num>[123])"),
-    re.compile(r"add the (?P<word>first|second|third)", re.IGNORECASE),
-    re.compile(r"add that"),
-)
+ORDINAL_MAP = {"first": 1, "second": 2, "third": 3}
 
-MEDIA_ADD_LIST_PATTERNS = (
-    re.compile(r"add (?:it|that) to my list"),
-    re.compile(r"save (?:it|that)"),
-    re.compile(r"add to my list"),
-)
 
-ORDINAL_MAP = {"first": 1, "second": 2, "third": 3}
+def _build_recommend_matcher():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in MEDIA_RECOMMEND_KEYWORDS:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass keyword scan when pyahocorasick is installed; otherwise the plain
+# substring loop, which beats any pure-Python prefilter for this handful of phrases.
+_RECOMMEND_AC = _build_recommend_matcher()
+
+
+def _mentions_recommend(lowered: str) -> bool:
+    if _RECOMMEND_AC is not None:
+        return next(_RECOMMEND_AC.iter(lowered), None) is not None
+    for phrase in MEDIA_RECOMMEND_KEYWORDS:
+        if phrase in lowered:
+            return True
+    return False
+
+
+# Request and add-to-list rules in priority order, fused into one alternation.
+# Iterating the matches finds every rule present; the highest-priority one wins,
+# as if each rule's patterns were checked in turn. No rule can begin inside
+# another rule's match, so non-overlapping iteration never hides a candidate.
+# Each ordinal word in ORDINAL_MAP is its own group sharing one rank, so the
+# pick is decided by which group matched rather than by looking the word up.
+_RULES = (
+    ("request_num", 0, r"add (?:number\s*)?(?P<num>[123])"),
+    *((f"request_{word}", 1, f"add the {word}") for word in ORDINAL_MAP),
+    ("request_that", 2, r"add that"),
+    ("add_list", 3, r"add (?:it|that) to my list|save (?:it|that)|add to my list"),
+)
+_RULE_RE = re.compile("|".join(f"(?P<{name}>{body})" for name, _, body in _RULES))
+_RULE_RANK = {name: rank for name, rank, _ in _RULES}
+# Fixed picks of the MEDIA_REQUEST rules that carry no number.
+_RULE_PICK = {f"request_{word}": pick for word, pick in ORDINAL_MAP.items()}
+_RULE_PICK["request_that"] = 1
+# Shortest text any rule can match ("add 1"); anything shorter skips all work.
+_MIN_MATCH_LEN = 5
 
 
 def detect_intent(text: str) -> Tuple[Optional[str], Dict[str, object]]:
     """Return the canonical media intent and extracted slots."""
 
-    lowered = text.lower().strip()
-    if not lowered:
+    if len(text) < _MIN_MATCH_LEN:
         return None, {}
+    return detect_intent_lowered(text.lower())
 
-    for phrase in MEDIA_RECOMMEND_KEYWORDS:
-        if phrase in lowered:
-            return "MEDIA_RECOMMEND", {}
 
-    for pattern in MEDIA_REQUEST_PATTERNS:
-        match = pattern.search(lowered)
-        if match:
-            if "num" in match.groupdict():
-                return "MEDIA_REQUEST", {"pick": int(match.group("num"))}
-            if "word" in match.groupdict():
-                word = match.group("word")
-                return "MEDIA_REQUEST", {"pick": ORDINAL_MAP.get(word.lower(), 1)}
-            return "MEDIA_REQUEST", {"pick": 1}
+def detect_intent_lowered(lowered: str) -> Tuple[Optional[str], Dict[str, object]]:
+    """Like :func:`detect_intent` for text the caller has already lower-cased."""
 
-    for pattern in MEDIA_ADD_LIST_PATTERNS:
-        if pattern.search(lowered):
-            return "MEDIA_ADD_TO_LIST", {"pick": 1}
+    if len(lowered) < _MIN_MATCH_LEN:
+        return None, {}
+
+    if _mentions_recommend(lowered):
+        return "MEDIA_RECOMMEND", {}
+
+    # Every rule needs "add" or "save"; most utterances have neither and stop here.
+    if "add" not in lowered and "save" not in lowered:
+        return None, {}
+
+    best = None
+    for match in _RULE_RE.finditer(lowered):
+        if best is None or _RULE_RANK[match.lastgroup] < _RULE_RANK[best.lastgroup]:
+            best = match
+    if best is None:
+        return None, {}
 
-    return None, {}
+    rule = best.lastgroup
+    if rule == "request_num":
+        return "MEDIA_REQUEST", {"pick": int(best.group("num"))}
+    pick = _RULE_PICK.get(rule)
+    if pick is not None:
+        return "MEDIA_REQUEST", {"pick": pick}
+    return "MEDIA_ADD_TO_LIST", {"pick": 1}
 
 
-__all__ = ["detect_intent"]
+__all__ = ["detect_intent", "detect_intent_lowered"]
@@ -3,15 +3,118 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Dict, Mapping, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from orchestrator.policy_engine.trust_scoring import Role
-from orchestrator.routing.intent_map import detect_intent
+try:  # pragma: no cover - optional multi-pattern matcher
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - fall back to substring checks
+    ahocorasick = None  # type: ignore
 
+from orchestrator.routing.intent_map import detect_intent_lowered
 
-@dataclass
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from orchestrator.policy_engine.trust_scoring import Role
+
+_TEMP_RE = re.compile(r"(-?\d{2,3})(?:\.?\d)?")
+
+# Clause punctuation that never appears in a keyword. "." and "-" are kept
+# because temperatures like "-5" and "21.5" depend on them.
+_SEPARATORS = str.maketrans({char: " " for char in ",;:!?\"()"})
+
+
+def _canonicalize(text: str) -> str:
+    """Lower-case ``text``, turn clause punctuation into spaces and collapse whitespace.
+
+    Surface variants of one utterance ("Turn on the lights!", "turn on  the
+    lights") share a canonical form and therefore one cache entry. Stopwords
+    are kept: several rules ("add the first", "suggest a show") contain them.
+    """
+
+    return " ".join(text.lower().translate(_SEPARATORS).split())
+
+
+# Every keyword the classification rules test for, mapped to one bit each.
+_KEYWORD_BITS: Dict[str, int] = {
+    keyword: 1 << index
+    for index, keyword in enumerate(
+        (
+            "disarm",
+            "alarm",
+            "unlock",
+            "door",
+            "open",
+            "garage",
+            "lock",
+            "turn on",
+            "switch on",
+            "lights on",
+            "turn off",
+            "switch off",
+            "lights off",
+            "temperature",
+            "thermostat",
+            "play",
+            "pause",
+        )
+    )
+}
+
+
+def _bits(*keywords: str) -> int:
+    mask = 0
+    for keyword in keywords:
+        mask |= _KEYWORD_BITS[keyword]
+    return mask
+
+
+# Rules needing all of their keywords.
+_DISARM_ALARM = _bits("disarm", "alarm")
+_UNLOCK_DOOR = _bits("unlock", "door")
+_OPEN_GARAGE = _bits("open", "garage")
+_LOCK_DOOR = _bits("lock", "door")
+# Rules needing any of their keywords.
+_LIGHTS_ON = _bits("turn on", "switch on", "lights on")
+_LIGHTS_OFF = _bits("turn off", "switch off", "lights off")
+_CLIMATE = _bits("temperature", "thermostat")
+_MEDIA = _bits("play", "pause")
+
+
+def _build_keyword_matcher():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, bit in _KEYWORD_BITS.items():
+        automaton.add_word(keyword, bit)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AC = _build_keyword_matcher()
+_KEYWORD_ITEMS = tuple(_KEYWORD_BITS.items())
+
+
+def _keyword_mask(lowered: str) -> int:
+    """Return the bitset of rule keywords present in ``lowered``.
+
+    With pyahocorasick this is a single pass that also reports overlapping
+    keywords ("unlock" and "lock"); otherwise each keyword is a substring test.
+    """
+
+    mask = 0
+    if _KEYWORD_AC is not None:
+        for _, bit in _KEYWORD_AC.iter(lowered):
+            mask |= bit
+        return mask
+    for keyword, bit in _KEYWORD_ITEMS:
+        if keyword in lowered:
+            mask |= bit
+    return mask
+
+
+@dataclass(slots=True)
 class IntentClassification:
     """Outcome of lightweight keyword intent parsing."""
 
@@ -58,21 +161,89 @@ class RouterConfig(BaseModel):
     default_climate: Optional[str] = "climate.living"
 
 
+_VOCAB_LIGHT, _VOCAB_LOCK, _VOCAB_CLIMATE, _VOCAB_MEDIA = range(4)
+_Vocabulary = Tuple[Tuple[str, str], ...]
+
+
+def _longest_first(vocabulary: Mapping[str, str]) -> _Vocabulary:
+    """Order ``(keyword, entity)`` pairs so longer keywords are tried first."""
+
+    return tuple(sorted(vocabulary.items(), key=lambda item: len(item[0]), reverse=True))
+
+
+def _build_entity_matcher(vocabs: Tuple[_Vocabulary, ...]):
+    """Build one automaton over every vocabulary, tagging hits with (vocab, rank, entity)."""
+
+    if ahocorasick is None:
+        return None
+    tagged: Dict[str, List[Tuple[int, int, str]]] = {}
+    for vocab, ordered in enumerate(vocabs):
+        for rank, (keyword, entity) in enumerate(ordered):
+            if not keyword:
+                return None  # an empty keyword matches everywhere; leave it to the scan
+            tagged.setdefault(keyword, []).append((vocab, rank, entity))
+    automaton = ahocorasick.Automaton()
+    for keyword, entries in tagged.items():
+        automaton.add_word(keyword, tuple(entries))
+    automaton.make_automaton()
+    return automaton
+
+
 class MessageRouter:
     """Applies deterministic keyword heuristics to classify intents."""
 
+    CACHE_SIZE = 256
+
     def __init__(self, config: Optional[RouterConfig] = None) -> None:
+        # Classification is a pure function of (text, role, config), so repeated
+        # utterances are answered from a per-router LRU cache.
+        self._classify_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._classify_impl)
         self.config = config or RouterConfig()
 
+    @property
+    def config(self) -> RouterConfig:
+        return self._config
+
+    @config.setter
+    def config(self, value: RouterConfig) -> None:
+        # Ordered vocabularies and cached results derive from the config. Mutating
+        # it in place is not tracked; reassign ``config`` to pick up such changes.
+        self._config = value
+        self._vocabs = (
+            _longest_first(value.light_entities),
+            _longest_first(value.lock_entities),
+            _longest_first(value.climate_entities),
+            _longest_first(value.media_entities),
+        )
+        self._entity_ac = _build_entity_matcher(self._vocabs)
+        self._classify_cached.cache_clear()
+
+    def cache_clear(self) -> None:
+        """Drop memoized classifications."""
+
+        self._classify_cached.cache_clear()
+
     # ------------------------------------------------------------------
     def classify(self, text: str, role: Role) -> IntentClassification:
         """Return the canonical intent, slots, and persona bias for ``text``."""
 
-        lowered = text.lower().strip()
+        # Punctuation-only text canonicalizes to "" but is not empty input; it
+        # keeps its own key so it is classified as typed.
+        cached = self._classify_cached(_canonicalize(text) or text.lower().strip(), role)
+        # Cached instances are shared; hand out a private slots dict.
+        return IntentClassification(
+            intent=cached.intent,
+            slots=dict(cached.slots),
+            sensitive=cached.sensitive,
+            persona_bias=cached.persona_bias,
+            confidence=cached.confidence,
+        )
+
+    def _classify_impl(self, lowered: str, role: Role) -> IntentClassification:
         if not lowered:
             return IntentClassification(intent=None, slots={}, sensitive=False, persona_bias="HALSTON", confidence=0.0)
 
-        media_intent, media_slots = detect_intent(lowered)
+        media_intent, media_slots = detect_intent_lowered(lowered)
         if media_intent:
             return IntentClassification(
                 intent=media_intent,
@@ -83,7 +254,9 @@ class MessageRouter:
             )
 
         # Security-first commands -------------------------------------------------
-        if "disarm" in lowered and "alarm" in lowered:
+        mask = _keyword_mask(lowered)
+
+        if mask & _DISARM_ALARM == _DISARM_ALARM:
             return IntentClassification(
                 intent="disarm_alarm",
                 slots={},
@@ -91,8 +264,8 @@ class MessageRouter:
                 persona_bias="SCARLET",
                 confidence=0.9,
             )
-        if "unlock" in lowered and "door" in lowered:
-            slots = {"entity_id": self._match_entity(lowered, self.config.lock_entities, self.config.default_lock)}
+        if mask & _UNLOCK_DOOR == _UNLOCK_DOOR:
+            slots = {"entity_id": self._match_entity(lowered, _VOCAB_LOCK, self.config.default_lock)}
             return IntentClassification(
                 intent="unlock_door",
                 slots=slots,
@@ -100,7 +273,7 @@ class MessageRouter:
                 persona_bias="SCARLET",
                 confidence=0.85,
             )
-        if "open" in lowered and "garage" in lowered:
+        if mask & _OPEN_GARAGE == _OPEN_GARAGE:
             slots = {"entity_id": self.config.garage_entity}
             return IntentClassification(
                 intent="open_garage",
@@ -109,8 +282,8 @@ class MessageRouter:
                 persona_bias="SCARLET",
                 confidence=0.8,
             )
-        if "lock" in lowered and "door" in lowered:
-            slots = {"entity_id": self._match_entity(lowered, self.config.lock_entities, self.config.default_lock)}
+        if mask & _LOCK_DOOR == _LOCK_DOOR:
+            slots = {"entity_id": self._match_entity(lowered, _VOCAB_LOCK, self.config.default_lock)}
             return IntentClassification(
                 intent="lock_door",
                 slots=slots,
@@ -120,8 +293,8 @@ class MessageRouter:
             )
 
         # Lighting ----------------------------------------------------------------
-        if any(token in lowered for token in ("turn on", "switch on", "lights on")):
-            slots = {"entity_id": self._match_entity(lowered, self.config.light_entities, self.config.default_light)}
+        if mask & _LIGHTS_ON:
+            slots = {"entity_id": self._match_entity(lowered, _VOCAB_LIGHT, self.config.default_light)}
             return IntentClassification(
                 intent="turn_on_light",
                 slots=slots,
@@ -129,8 +302,8 @@ class MessageRouter:
                 persona_bias="HALSTON",
                 confidence=0.75,
             )
-        if any(token in lowered for token in ("turn off", "switch off", "lights off")):
-            slots = {"entity_id": self._match_entity(lowered, self.config.light_entities, self.config.default_light)}
+        if mask & _LIGHTS_OFF:
+            slots = {"entity_id": self._match_entity(lowered, _VOCAB_LIGHT, self.config.default_light)}
             return IntentClassification(
                 intent="turn_off_light",
                 slots=slots,
@@ -140,9 +313,9 @@ class MessageRouter:
             )
 
         # Climate -----------------------------------------------------------------
-        if "temperature" in lowered or "thermostat" in lowered:
+        if mask & _CLIMATE:
             slots = {
-                "entity_id": self._match_entity(lowered, self.config.climate_entities, self.config.default_climate),
+                "entity_id": self._match_entity(lowered, _VOCAB_CLIMATE, self.config.default_climate),
                 "temperature": self._extract_temperature(lowered),
             }
             return IntentClassification(
@@ -154,8 +327,8 @@ class MessageRouter:
             )
 
         # Media -------------------------------------------------------------------
-        if "play" in lowered or "pause" in lowered:
-            slots = {"entity_id": self._match_entity(lowered, self.config.media_entities, self.config.default_media_player)}
+        if mask & _MEDIA:
+            slots = {"entity_id": self._match_entity(lowered, _VOCAB_MEDIA, self.config.default_media_player)}
             return IntentClassification(
                 intent="media_play_pause",
                 slots=slots,
@@ -169,17 +342,23 @@ class MessageRouter:
         return IntentClassification(intent=None, slots={}, sensitive=False, persona_bias=bias, confidence=0.3)
 
     # ------------------------------------------------------------------
-    def _match_entity(self, lowered_text: str, vocabulary: Mapping[str, str], default: Optional[str]) -> Optional[str]:
-        for keyword, entity in sorted(vocabulary.items(), key=lambda item: len(item[0]), reverse=True):
+    def _match_entity(self, lowered_text: str, vocab: int, default: Optional[str]) -> Optional[str]:
+        if self._entity_ac is not None:
+            # One pass reports every vocabulary's hits; keep the best-ranked one
+            # (longest keyword, then config order) from the requested vocabulary.
+            best_rank = -1
+            best = default
+            for _, tagged in self._entity_ac.iter(lowered_text):
+                for tag_vocab, rank, entity in tagged:
+                    if tag_vocab == vocab and (best_rank < 0 or rank < best_rank):
+                        best_rank, best = rank, entity
+            return best
+        for keyword, entity in self._vocabs[vocab]:
             if keyword in lowered_text:
                 return entity
         return default
 
     def _extract_temperature(self, lowered_text: str) -> Optional[float]:
-        match = re.search(r"(-?\d{2,3})(?:\.?\d)?", lowered_text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:  # pragma: no cover - defensive guard
-                return None
-        return None
+        match = _TEMP_RE.search(lowered_text)
+        # The group is always an optionally signed run of digits, so the cast cannot fail.
+        return float(match.group(1)) if match else None
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from typing import Any, Callable, Optional
 
+MQTT_ERR_SUCCESS = 0
+MQTT_ERR_QUEUE_SIZE = 15
+
 
 class Client:
     """Extremely small subset of the Paho MQTT client interface."""
@@ -22,6 +25,12 @@ class Client:
     def tls_set(self, *args: Any, **kwargs: Any) -> None:  # pragma: no cover - placeholder
         self._tls_args = (args, kwargs)
 
+    def max_inflight_messages_set(self, inflight: int) -> None:  # pragma: no cover - trivial
+        self._max_inflight = inflight
+
+    def max_queued_messages_set(self, queue_size: int) -> None:  # pragma: no cover - trivial
+        self._max_queued = queue_size
+
     # Network lifecycle --------------------------------------------------
     def connect(self, host: str, port: int, keepalive: int) -> None:  # pragma: no cover - placeholder
         self._connection = (host, port, keepalive)
@@ -32,6 +41,15 @@ class Client:
     def loop_start(self) -> None:  # pragma: no cover - placeholder
         return None
 
+    def loop_stop(self) -> None:  # pragma: no cover - placeholder
+        return None
+
+    def reconnect_delay_set(self, min_delay: int = 1, max_delay: int = 120) -> None:  # pragma: no cover - trivial
+        self._reconnect_delay = (min_delay, max_delay)
+
+    def is_connected(self) -> bool:  # pragma: no cover - placeholder
+        return False
+
     # Messaging ----------------------------------------------------------
     def publish(self, topic: str, payload: str, qos: int = 0, retain: bool = False) -> bool:
         self._last_published = (topic, payload, qos, retain)
@@ -7,7 +7,7 @@ runtime modules without installing the real dependency.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 __all__ = [
     "BaseModel",
@@ -26,7 +26,7 @@ class _Missing:
 MISSING = _Missing()
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldInfo:
     """Container describing default values supplied to :func:`Field`."""
 
@@ -54,16 +54,45 @@ def Field(
     return FieldInfo(default=default, default_factory=default_factory)
 
 
+# How a field's default is produced, resolved once per class.
+_DEFAULT_VALUE, _DEFAULT_FIELD, _DEFAULT_CALL, _DEFAULT_REQUIRED = range(4)
+
+
+def _default_kind(default: Any) -> int:
+    if isinstance(default, FieldInfo):
+        return _DEFAULT_FIELD
+    if default is MISSING or default is Ellipsis:
+        return _DEFAULT_REQUIRED
+    if callable(default):
+        return _DEFAULT_CALL
+    return _DEFAULT_VALUE
+
+
 class BaseModel:
     """Very small subset of :class:`pydantic.BaseModel` semantics."""
 
+    # (name, default kind, default) per field, computed when the subclass is
+    # created. Deliberately unannotated so it is not collected as a field.
+    __halcyon_fields__ = ()  # type: Tuple[Tuple[str, int, Any], ...]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__halcyon_fields__ = tuple(
+            (name, _default_kind(default), default) for name, default in cls._collect_fields().items()
+        )
+
     def __init__(self, **data: Any) -> None:
-        fields = self._collect_fields()
-        for name, default in fields.items():
+        for name, kind, default in self.__halcyon_fields__:
             if name in data:
                 value = data.pop(name)
+            elif kind == _DEFAULT_VALUE:
+                value = default
+            elif kind == _DEFAULT_FIELD:
+                value = default.get_default()
+            elif kind == _DEFAULT_CALL:
+                value = default()
             else:
-                value = self._resolve_default(default, field=name)
+                raise ValueError(f"Missing required field: {name}")
             setattr(self, name, value)
         for key, value in data.items():
             setattr(self, key, value)
@@ -78,16 +107,6 @@ class BaseModel:
                     fields[name] = getattr(base, name, MISSING)
         return fields
 
-    @staticmethod
-    def _resolve_default(default: Any, *, field: str) -> Any:
-        if isinstance(default, FieldInfo):
-            return default.get_default()
-        if default is MISSING or default is Ellipsis:
-            raise ValueError(f"Missing required field: {field}")
-        if callable(default):
-            return default()
-        return default
-
     def dict(self, *, exclude_none: bool = False) -> Dict[str, Any]:
         result = {key: getattr(self, key) for key in self.__dict__}
         if exclude_none:
@@ -3,37 +3,186 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import RedisError, ResponseError, WatchError
+
+
+_WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+# Keys are spread over lock stripes so unrelated keys never contend.
+_STRIPES = 16
 
 
 class _InMemoryRedis:
     def __init__(self) -> None:
-        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
-        self._lock = threading.RLock()
+        self._shards: List[Dict[str, Tuple[Any, Optional[float]]]] = [{} for _ in range(_STRIPES)]
+        # Reentrant: getex/hset/expire build on get, and transactional pipelines
+        # hold every stripe while running the public commands.
+        self._locks = [threading.RLock() for _ in range(_STRIPES)]
+
+    def _stripe(self, key: str) -> Tuple[Dict[str, Tuple[Any, Optional[float]]], threading.RLock]:
+        index = hash(key) & (_STRIPES - 1)
+        return self._shards[index], self._locks[index]
 
-    def get(self, key: str) -> Optional[str]:
-        with self._lock:
-            value = self._data.get(key)
+    def _peek(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        data, lock = self._stripe(key)
+        with lock:
+            return data.get(key)
+
+    def _lock_all(self) -> None:
+        for lock in self._locks:
+            lock.acquire()
+
+    def _unlock_all(self) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def get(self, key: str) -> Any:
+        data, lock = self._stripe(key)
+        with lock:
+            value = data.get(key)
             if value is None:
                 return None
             payload, expires_at = value
-            if expires_at is not None and expires_at < time.time():
-                self._data.pop(key, None)
+            if expires_at is not None and expires_at < time.monotonic():
+                data.pop(key, None)
                 return None
             return payload
 
-    def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
-        with self._lock:
-            expiry = time.time() + ex if ex else None
-            self._data[key] = (value, expiry)
+    def mget(self, keys: Any, *args: str) -> List[Any]:
+        names = [keys] if isinstance(keys, (str, bytes)) else list(keys)
+        names.extend(args)
+        return [self.get(key) for key in names]
+
+    def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        data, lock = self._stripe(key)
+        with lock:
+            if nx and self.get(key) is not None:
+                return None
+            expiry = time.monotonic() + ex if ex else None
+            data[key] = (value, expiry)
+            return True
+
+    def getex(self, key: str, ex: Optional[int] = None) -> Any:
+        data, lock = self._stripe(key)
+        with lock:
+            value = self.get(key)
+            if value is not None and ex:
+                data[key] = (value, time.monotonic() + ex)
+            return value
+
+    def hset(self, key: str, field: Optional[str] = None, value: Any = None, mapping: Optional[Dict[str, Any]] = None) -> int:
+        data, lock = self._stripe(key)
+        with lock:
+            current = self.get(key)
+            if current is not None and not isinstance(current, dict):
+                raise ResponseError(_WRONGTYPE)
+            expiry = data[key][1] if current is not None else None
+            fields = dict(current) if current is not None else {}
+            before = len(fields)
+            if field is not None:
+                fields[field] = value
+            fields.update(mapping or {})
+            data[key] = (fields, expiry)
+            return len(fields) - before
+
+    def hgetall(self, key: str) -> Dict[str, Any]:
+        value = self.get(key)
+        if value is not None and not isinstance(value, dict):
+            raise ResponseError(_WRONGTYPE)
+        return dict(value) if value is not None else {}
+
+    def expire(self, key: str, seconds: int) -> bool:
+        data, lock = self._stripe(key)
+        with lock:
+            if self.get(key) is None:
+                return False
+            data[key] = (data[key][0], time.monotonic() + seconds)
+            return True
 
     def delete(self, key: str) -> None:
-        with self._lock:
-            self._data.pop(key, None)
+        data, lock = self._stripe(key)
+        with lock:
+            data.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "_Pipeline":
+        return _Pipeline(self, transaction=transaction)
+
+
+class _Pipeline:
+    """Buffered command pipeline mirroring the redis-py ``Pipeline`` surface."""
+
+    def __init__(self, client: _InMemoryRedis, *, transaction: bool = True) -> None:
+        self._client = client
+        self._transaction = transaction
+        self._commands: List[Tuple[Callable[..., Any], tuple, dict]] = []
+        self._watched: Dict[str, Any] = {}
+        self._immediate = False
+
+    def __enter__(self) -> "_Pipeline":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.reset()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        command = getattr(self._client, name)
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            if self._immediate:
+                return command(*args, **kwargs)
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return _call
+
+    def watch(self, *keys: str) -> None:
+        self._immediate = True
+        for key in keys:
+            self._watched[key] = self._client._peek(key)
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    def execute(self) -> List[Any]:
+        client = self._client
+        client._lock_all()
+        try:
+            for key, snapshot in self._watched.items():
+                if client._peek(key) is not snapshot:
+                    raise WatchError(f"Watched key changed: {key}")
+            return [command(*args, **kwargs) for command, args, kwargs in self._commands]
+        finally:
+            client._unlock_all()
+            self.reset()
+
+    def reset(self) -> None:
+        self._commands.clear()
+        self._watched.clear()
+        self._immediate = False
+
+
+class ConnectionPool:
+    """Records pool configuration; the shim shares one store per URL instead."""
+
+    def __init__(self, url: str, **connection_kwargs: Any) -> None:
+        self.url = url
+        self.connection_kwargs = connection_kwargs
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "ConnectionPool":
+        return cls(url, **kwargs)
 
 
 _instances: Dict[str, _InMemoryRedis] = {}
-_instances_lock = threading.RLock()
+_instances_lock = threading.Lock()
+
+
+def Redis(*, connection_pool: ConnectionPool, **_: Any) -> _InMemoryRedis:  # pragma: no cover - trivial
+    """Return the shared in-memory instance backing ``connection_pool``."""
+
+    return from_url(connection_pool.url)
 
 
 def from_url(url: str, *, decode_responses: bool = False):  # pragma: no cover - trivial
@@ -0,0 +1,17 @@
+"""Exception types mirrored from redis-py."""
+from __future__ import annotations
+
+
+class RedisError(Exception):
+    """Base class for Redis client errors."""
+
+
+class ResponseError(RedisError):
+    """Raised when the server rejects a command, e.g. WRONGTYPE."""
+
+
+class WatchError(RedisError):
+    """Raised when a watched key changes before a transaction executes."""
+
+
+__all__ = ["RedisError", "ResponseError", "WatchError"]
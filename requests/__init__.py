@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class _Response:
     status_code: int = 200
     content: bytes = b""
@@ -17,7 +17,7 @@ class _Response:
             raise RuntimeError(f"HTTP {self.status_code}")
 
     def json(self) -> Any:  # pragma: no cover - trivial
-        return self._json or {}
+        return {} if self._json is None else self._json
 
 
 class Session:
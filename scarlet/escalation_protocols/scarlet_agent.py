@@ -1,13 +1,37 @@
 """SCARLET persona escalation protocols."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Optional
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, List, Optional
 
 from pydantic import BaseModel, Field
 
 from orchestrator.policy_engine.access_control import AccessDecision
 
+try:  # pragma: no cover - optional JIT for the keyword scan
+    from numba import njit
+except Exception:  # pragma: no cover - run the scan as plain Python
+    njit = None  # type: ignore
+
+_SCAN_ALERT, _SCAN_OVERRIDE, _SCAN_FALLBACK = range(3)
+_SCAN_INTENTS = ("security.alert", "system.override")
+
+
+def _scarlet_scan(lowered: str) -> int:
+    """Classify lowered text as alert, override or fallback using substring tests only."""
+
+    if "panic" in lowered or "intruder" in lowered or "help" in lowered:
+        return _SCAN_ALERT
+    if "override" in lowered or "admin" in lowered:
+        return _SCAN_OVERRIDE
+    return _SCAN_FALLBACK
+
+
+if njit is not None:  # pragma: no cover - depends on numba being installed
+    _scarlet_scan = njit(cache=True)(_scarlet_scan)
+
 
 class EscalationHook(BaseModel):
     """Defines an escalation callback and the intents that should trigger it."""
@@ -29,9 +53,10 @@ class ScarletConfig(BaseModel):
     )
     fallback_intent: str = "security.review"
     escalation_hooks: Iterable[EscalationHook] = Field(default_factory=list)
+    incident_buffer: int = 10_000
 
 
-@dataclass
+@dataclass(slots=True)
 class IncidentRecord:
     """Captured audit record of a security incident."""
 
@@ -45,9 +70,14 @@ class ScarletAgent:
 
     def __init__(self, config: Optional[ScarletConfig] = None) -> None:
         self.config = config or ScarletConfig()
-        self._incidents: list[IncidentRecord] = []
+        # Only recent incidents are ever read, so the oldest are dropped past the cap.
+        self._incidents: Deque[IncidentRecord] = deque(maxlen=self.config.incident_buffer)
         self._monitored = {intent for intent in self.config.monitored_intents}
-        self._hooks = list(self.config.escalation_hooks)
+        # Intent -> hooks in registration order, so dispatch is one dict lookup.
+        self._hook_index: Dict[str, List[EscalationHook]] = {}
+        for hook in self.config.escalation_hooks:
+            for hook_intent in dict.fromkeys(hook.intents):
+                self._hook_index.setdefault(hook_intent, []).append(hook)
 
     def infer_intent(self, text: str, hint: Optional[str] = None) -> str:
         """Prioritize security-related intents."""
@@ -55,12 +85,10 @@ class ScarletAgent:
         if hint:
             return hint
 
-        lowered = text.lower()
-        if any(keyword in lowered for keyword in ("panic", "intruder", "help")):
-            return "security.alert"
-        if "override" in lowered or "admin" in lowered:
-            return "system.override"
-        return self.config.fallback_intent
+        code = _scarlet_scan(text.lower())
+        if code == _SCAN_FALLBACK:
+            return self.config.fallback_intent
+        return _SCAN_INTENTS[code]
 
     def generate_response(self, text: str, *, intent: Optional[str], metadata: Dict[str, object]) -> str:
         """Produce a concise response and trigger escalation hooks if needed."""
@@ -90,11 +118,15 @@ class ScarletAgent:
     def recent_incidents(self, limit: int = 10) -> list[IncidentRecord]:
         """Return the most recent incident records."""
 
-        return self._incidents[-limit:]
+        if 0 < limit < len(self._incidents):
+            # Walk back from the newest record instead of copying the whole buffer.
+            tail = list(islice(reversed(self._incidents), limit))
+            tail.reverse()
+            return tail
+        return list(self._incidents)[-limit:]
 
     # Internal ---------------------------------------------------------
 
     def _notify_hooks(self, intent: str, metadata: Dict[str, object]) -> None:
-        for hook in self._hooks:
-            if intent in hook.intents:
-                hook.callback(intent, metadata)
+        for hook in self._hook_index.get(intent, ()):
+            hook.callback(intent, metadata)
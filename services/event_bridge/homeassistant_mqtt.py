@@ -2,7 +2,7 @@ from __future__ import annotations
 
 """MQTT bridge utilities for Home Assistant integration."""
 
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 import json
 import logging
 import ssl
@@ -11,10 +11,25 @@ import time
 
 import paho.mqtt.client as mqtt
 
+try:  # pragma: no cover - optional accelerated codec
+    import orjson
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Both decoders accept the raw payload bytes, so no intermediate str is built.
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
 class MQTTConnectionError(RuntimeError):
     """Raised when an MQTT operation cannot be completed."""
 
@@ -41,6 +56,7 @@ class HAMQTTBridge:
 
     SERVICE_TOPIC = "halcyon/ha/call"
     EVENT_TOPIC = "halcyon/ha/event/#"
+    NOTE_TOPIC_CACHE_MAX = 256
 
     def __init__(
         self,
@@ -73,8 +89,10 @@ class HAMQTTBridge:
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message
-        self._thread: Optional[threading.Thread] = None
-        self._lock = threading.RLock()
+        # Encoded '{"domain":...,"service":...,"data":' per service; only data and ts vary.
+        self._call_prefix_cache: Dict[Tuple[str, str], bytes] = {}
+        self._note_topics: Dict[str, str] = {}
+        self._lock = threading.Lock()
         self._connected = threading.Event()
         self._should_run = threading.Event()
 
@@ -84,17 +102,18 @@ class HAMQTTBridge:
         """Connect to the MQTT broker and start the network loop."""
 
         with self._lock:
-            if self._thread and self._thread.is_alive():
+            if self._should_run.is_set():
                 _LOGGER.debug("HAMQTTBridge already running")
                 return
-            self._should_run.set()
             self._connected.clear()
             try:
                 self._client.connect(self.host, self.port, keepalive=self.keepalive)
             except Exception as exc:  # pragma: no cover - depends on network
                 raise MQTTConnectionError("Failed to connect to MQTT broker") from exc
-            self._thread = threading.Thread(target=self._loop_forever, daemon=True)
-            self._thread.start()
+            self._should_run.set()
+            # paho's network thread reconnects on its own, backing off up to 30s.
+            self._client.reconnect_delay_set(min_delay=1, max_delay=30)
+            self._client.loop_start()
         if wait:
             if not self._connected.wait(timeout=timeout):
                 raise MQTTConnectionError("Timed out waiting for MQTT connection")
@@ -103,15 +122,15 @@ class HAMQTTBridge:
         """Stop the background MQTT loop and disconnect the client."""
 
         with self._lock:
+            if not self._should_run.is_set():
+                return
             self._should_run.clear()
             if self._client.is_connected():
                 try:
                     self._client.disconnect()
                 except Exception:  # pragma: no cover - defensive
                     _LOGGER.exception("Error disconnecting from MQTT broker")
-            if self._thread and self._thread.is_alive():
-                self._thread.join(timeout=2.0)
-            self._thread = None
+            self._client.loop_stop()
             self._connected.clear()
 
     # ------------------------------------------------------------------
@@ -129,7 +148,6 @@ class HAMQTTBridge:
         self._connected.clear()
         if self._should_run.is_set():
             _LOGGER.warning("Unexpected MQTT disconnect (code=%s), retrying...", rc)
-            self._schedule_reconnect()
         else:
             _LOGGER.info("MQTT client disconnected")
 
@@ -138,7 +156,7 @@ class HAMQTTBridge:
             return
         payload: Dict[str, Any]
         try:
-            payload = json.loads(msg.payload.decode("utf-8"))
+            payload = _loads(msg.payload)
         except Exception:  # pragma: no cover - defensive
             payload = {"raw": msg.payload.decode("utf-8", errors="ignore")}
         try:
@@ -151,18 +169,22 @@ class HAMQTTBridge:
     def call_service(self, domain: str, service: str, data: Dict[str, Any]) -> bool:
         """Publish a Home Assistant service call request."""
 
-        message = {
-            "domain": domain,
-            "service": service,
-            "data": data,
-            "ts": time.time(),
-        }
-        return self._publish_json(self.SERVICE_TOPIC, message, qos=1)
+        prefix = self._call_prefix_cache.get((domain, service))
+        if prefix is None:
+            prefix = self._call_prefix_cache[(domain, service)] = (
+                b'{"domain":' + _dumps(domain) + b',"service":' + _dumps(service) + b',"data":'
+            )
+        message = b"".join((prefix, _dumps(data), b',"ts":', repr(time.time()).encode("ascii"), b"}"))
+        return self._publish_bytes(self.SERVICE_TOPIC, message, qos=1)
 
     def publish_note(self, topic_suffix: str, payload: Dict[str, Any], *, qos: int = 1) -> bool:
         """Publish an auxiliary message under the ``halcyon/`` namespace."""
 
-        topic = f"halcyon/{topic_suffix.lstrip('/')}"
+        topic = self._note_topics.get(topic_suffix)
+        if topic is None:
+            if len(self._note_topics) >= self.NOTE_TOPIC_CACHE_MAX:
+                self._note_topics.clear()
+            topic = self._note_topics[topic_suffix] = f"halcyon/{topic_suffix.lstrip('/')}"
         return self._publish_json(topic, payload, qos=qos)
 
     def wait_until_connected(self, timeout: float | None = None) -> bool:
@@ -172,24 +194,10 @@ class HAMQTTBridge:
 
     # ------------------------------------------------------------------
     # Internal helpers
-    def _loop_forever(self) -> None:
-        while self._should_run.is_set():
-            try:
-                self._client.loop_forever()
-            except Exception:  # pragma: no cover - depends on network
-                _LOGGER.exception("MQTT loop exited unexpectedly; retrying")
-                time.sleep(1.0)
-            if self._should_run.is_set() and not self._connected.is_set():
-                try:
-                    self._client.reconnect()
-                except Exception:  # pragma: no cover - depends on network
-                    _LOGGER.warning("Reconnection attempt failed", exc_info=True)
-                    time.sleep(2.0)
-            else:
-                break
-
     def _publish_json(self, topic: str, payload: Dict[str, Any], *, qos: int) -> bool:
-        data = json.dumps(payload, separators=(",", ":"))
+        return self._publish_bytes(topic, _dumps(payload), qos=qos)
+
+    def _publish_bytes(self, topic: str, data: bytes, *, qos: int) -> bool:
         try:
             info = self._client.publish(topic, data, qos=qos, retain=False)
         except Exception:  # pragma: no cover - depends on network
@@ -200,19 +208,5 @@ class HAMQTTBridge:
             return False
         return True
 
-    def _schedule_reconnect(self) -> None:
-        def _reconnect() -> None:
-            delay = 1.0
-            while self._should_run.is_set() and not self._connected.is_set():
-                try:
-                    self._client.reconnect()
-                    return
-                except Exception:  # pragma: no cover - depends on network
-                    _LOGGER.warning("MQTT reconnect attempt failed; retrying in %.1fs", delay)
-                    time.sleep(delay)
-                    delay = min(delay * 2, 30.0)
-
-        threading.Thread(target=_reconnect, daemon=True).start()
-
 
 __all__ = ["HAMQTTBridge", "MQTTConnectionError"]
@@ -0,0 +1,56 @@
+"""Shared HTTP session setup for the media API clients."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import requests
+
+try:  # pragma: no cover - optional transport tuning (absent from the test shim)
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except Exception:  # pragma: no cover - plain sessions without pooling tweaks
+    HTTPAdapter = None  # type: ignore
+    Retry = None  # type: ignore
+
+try:  # pragma: no cover - optional accelerated codec
+    import orjson
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+
+def pooled_session() -> requests.Session:
+    """Return a session sized for the recommender's concurrent fan-out.
+
+    The default adapter keeps ten connections per host, fewer than the
+    recommender issues at once. Transient gateway errors on idempotent
+    requests are retried twice with a short backoff.
+    """
+
+    session = requests.Session()
+    if HTTPAdapter is not None and Retry is not None:
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return session
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode the raw body of ``response``; an empty body decodes to ``{}``.
+
+    Parsing ``response.content`` directly skips the charset detection and
+    text decode that ``response.json()`` performs first. Malformed bodies
+    raise ``ValueError``.
+    """
+
+    content = response.content
+    if not content:
+        return {}
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+__all__ = ["decode_json", "pooled_session"]
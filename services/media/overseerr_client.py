@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Literal, Optional
 
 import requests
 
+from services.media.http_session import decode_json, pooled_session
+
 
 class OverseerrClient:
     """Interact with Overseerr's REST API."""
@@ -14,7 +16,7 @@ class OverseerrClient:
             raise ValueError("OverseerrClient requires base_url and api_key")
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._session = session or requests.Session()
+        self._session = session or pooled_session()
 
     # ------------------------------------------------------------------
     def search(self, query: str, type: Literal["movie", "tv"]) -> List[Dict[str, Any]]:
@@ -83,9 +85,7 @@ class OverseerrClient:
             timeout=10,
         )
         response.raise_for_status()
-        if response.content:
-            return response.json()
-        return {}
+        return decode_json(response)
 
 
 __all__ = ["OverseerrClient"]
@@ -2,18 +2,94 @@
 from __future__ import annotations
 
 import json
+import re
+import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 import requests
 
+from services.media.http_session import decode_json, pooled_session
+
 try:  # pragma: no cover - optional redis dependency
     import redis
 except Exception:  # pragma: no cover - fallback for tests
     redis = None  # type: ignore
 
+try:  # pragma: no cover - optional binary codec
+    import msgpack
+except Exception:  # pragma: no cover - fall back to JSON blobs
+    msgpack = None  # type: ignore
+
+try:  # pragma: no cover - optional accelerated codec
+    import orjson
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional blob compression
+    import zstandard
+except Exception:  # pragma: no cover - store blobs uncompressed
+    zstandard = None  # type: ignore
+
+try:  # pragma: no cover - optional streaming JSON parser
+    import ijson
+except Exception:  # pragma: no cover - parse whole history payloads
+    ijson = None  # type: ignore
+
 HistoryKind = Literal["movie", "show"]
+_HISTORY_PATH = "/status/sessions/history/all"
+_HISTORY_ITEMS = "MediaContainer.Metadata.item"
+_TMDB_GUID_RE = re.compile(r"tmdb://(\d+)")
+
+# Every zstd frame opens with this magic; msgpack and JSON list blobs never do,
+# so compressed and legacy uncompressed entries can share the cache.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+_zstd_local = threading.local()  # (de)compressor objects are not thread-safe
+
+
+def _zstd_codec() -> Tuple[Any, Any]:
+    codec = getattr(_zstd_local, "codec", None)
+    if codec is None:
+        codec = _zstd_local.codec = (
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL),
+            zstandard.ZstdDecompressor(),
+        )
+    return codec
+
+
+def _pack(value: List[Dict[str, Any]]) -> bytes:
+    if msgpack is not None:
+        blob = msgpack.packb(value, use_bin_type=True)
+    else:
+        blob = orjson.dumps(value) if orjson is not None else json.dumps(value).encode("utf-8")
+    if zstandard is not None:
+        return _zstd_codec()[0].compress(blob)
+    return blob
+
+
+def _unpack(raw: bytes) -> List[Dict[str, Any]]:
+    """Decode a (possibly zstd-compressed) cached blob; raises ``ValueError`` when unreadable."""
+
+    if raw[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("cached blob is zstd-compressed but zstandard is not installed")
+        try:
+            raw = _zstd_codec()[1].decompress(raw)
+        except zstandard.ZstdError as exc:
+            raise ValueError("corrupt zstd cache blob") from exc
+    if msgpack is not None:
+        try:
+            value = msgpack.unpackb(raw, raw=False)
+        except (msgpack.UnpackException, ValueError):
+            value = None  # legacy JSON blob written before the msgpack switch
+        if isinstance(value, list):
+            return value
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 @dataclass(slots=True)
@@ -25,6 +101,8 @@ class _CacheEntry:
 class PlexClient:
     """Thin Plex API wrapper focused on watch history and discovery."""
 
+    CACHE_MAX = 2048
+
     def __init__(
         self,
         *,
@@ -41,12 +119,14 @@ class PlexClient:
             raise ValueError("PlexClient requires base_url and token")
         self._base_url = base_url.rstrip("/")
         self._token = token
-        self._session = session or requests.Session()
+        self._session = session or pooled_session()
         self._library_movies = library_movies_section
         self._library_tv = library_tv_section
         self._user_name = user_name
         self._cache_ttl = cache_ttl
-        self._cache: Dict[Tuple[str, str, int], _CacheEntry] = {}
+        # Keys are interned "kind:subject:limit" strings; the Redis key adds a prefix.
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._cache_lock = threading.Lock()  # continue-watching runs on the recommender's pool
         self._redis = self._init_redis(redis_url)
 
     # ------------------------------------------------------------------
@@ -63,14 +143,13 @@ class PlexClient:
             # Guests do not receive personalized history for privacy reasons.
             return []
 
-        cache_key = ("history", f"{user_uuid}:{kind}", limit)
+        cache_key = sys.intern(f"history:{user_uuid}:{kind}:{limit}")
         cached = self._get_cached(cache_key)
         if cached is not None:
             return cached
 
-        payload = self._request_json(
-            "/status/sessions/history/all",
-            params={
+        entries = self._iter_history(
+            {
                 "type": 1 if kind == "movie" else 2,
                 "X-Plex-Token": self._token,
                 "accountID": self._user_name,
@@ -78,12 +157,47 @@ class PlexClient:
                 "json": 1,
             },
         )
-        entries = self._parse_history(payload)
-        filtered = [entry for entry in entries if self._entry_visible_to(entry, user_uuid)]
-        result = filtered[:limit]
+        try:
+            visible = (entry for entry in entries if self._entry_visible_to(entry, user_uuid))
+            result = list(islice(visible, limit))
+        finally:
+            entries.close()
         self._set_cached(cache_key, result)
         return result
 
+    def prefetch_users(self, user_uuids: Iterable[Optional[str]], kind: HistoryKind, *, limit: int = 200) -> int:
+        """Warm the in-memory history cache for several users with one Redis ``MGET``.
+
+        Returns the number of entries loaded. Users already cached in memory
+        are skipped; anything missing in Redis is fetched lazily as usual.
+        """
+
+        if self._redis is None:
+            return 0
+        now = time.time()
+        keys = []
+        with self._cache_lock:
+            for user_uuid in dict.fromkeys(user_uuids):
+                if user_uuid is None:
+                    continue
+                key = sys.intern(f"history:{user_uuid}:{kind}:{limit}")
+                entry = self._cache.get(key)
+                if entry is None or entry.expires_at <= now:
+                    keys.append(key)
+        if not keys:
+            return 0
+        loaded = 0
+        for key, raw in zip(keys, self._redis.mget([self._cache_key(key) for key in keys])):
+            if raw is None:
+                continue
+            try:
+                data = _unpack(raw)
+            except ValueError:
+                continue
+            self._remember(key, data, now + self._cache_ttl)
+            loaded += 1
+        return loaded
+
     def get_continue_watching(
         self,
         user_uuid: Optional[str],
@@ -95,14 +209,13 @@ class PlexClient:
         if user_uuid is None:
             return []
 
-        cache_key = ("continue", user_uuid, limit)
+        cache_key = sys.intern(f"continue:{user_uuid}:{limit}")
         cached = self._get_cached(cache_key)
         if cached is not None:
             return cached
 
-        payload = self._request_json(
-            "/status/sessions/history/all",
-            params={
+        entries = self._iter_history(
+            {
                 "X-Plex-Token": self._token,
                 "accountID": self._user_name,
                 "inProgress": 1,
@@ -110,9 +223,12 @@ class PlexClient:
                 "json": 1,
             },
         )
-        entries = [entry for entry in self._parse_history(payload) if entry.get("in_progress")]
-        self._set_cached(cache_key, entries[:limit])
-        return entries[:limit]
+        try:
+            result = list(islice((entry for entry in entries if entry.get("in_progress")), limit))
+        finally:
+            entries.close()
+        self._set_cached(cache_key, result)
+        return result
 
     def get_library_stats(self, user_uuid: Optional[str]) -> Dict[str, Any]:
         """Return aggregated library metadata used for recommendations."""
@@ -120,7 +236,7 @@ class PlexClient:
         if user_uuid is None:
             return {"movies": 0, "shows": 0}
 
-        cache_key = ("library", user_uuid, 0)
+        cache_key = sys.intern(f"library:{user_uuid}:0")
         cached = self._get_cached(cache_key)
         if cached is not None:
             return cached[0] if cached else {"movies": 0, "shows": 0}
@@ -145,33 +261,42 @@ class PlexClient:
     # ------------------------------------------------------------------
     def _init_redis(self, redis_url: Optional[str]):
         if redis_url and redis is not None:
-            return redis.from_url(redis_url, decode_responses=True)
+            # Cache blobs are msgpack or JSON bytes; both decode from raw bytes.
+            return redis.from_url(redis_url, decode_responses=False)
         return None
 
-    def _cache_key(self, key: Tuple[str, str, int]) -> str:
-        return f"halcyon:plex:{key[0]}:{key[1]}:{key[2]}"
+    def _cache_key(self, key: str) -> str:
+        return "halcyon:plex:" + key
 
-    def _get_cached(self, key: Tuple[str, str, int]) -> Optional[List[Dict[str, Any]]]:
+    def _get_cached(self, key: str) -> Optional[List[Dict[str, Any]]]:
         now = time.time()
-        entry = self._cache.get(key)
-        if entry and entry.expires_at > now:
-            return entry.value
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and entry.expires_at > now:
+                self._cache.move_to_end(key)
+                return entry.value
         if self._redis is not None:
             raw = self._redis.get(self._cache_key(key))
             if raw is not None:
                 try:
-                    data = json.loads(raw)
-                    self._cache[key] = _CacheEntry(value=data, expires_at=now + self._cache_ttl)
-                    return data
-                except json.JSONDecodeError:
+                    data = _unpack(raw)
+                except ValueError:
                     return None
+                self._remember(key, data, now + self._cache_ttl)
+                return data
         return None
 
-    def _set_cached(self, key: Tuple[str, str, int], value: List[Dict[str, Any]]) -> None:
-        expires = time.time() + self._cache_ttl
-        self._cache[key] = _CacheEntry(value=value, expires_at=expires)
+    def _set_cached(self, key: str, value: List[Dict[str, Any]]) -> None:
+        self._remember(key, value, time.time() + self._cache_ttl)
         if self._redis is not None:
-            self._redis.set(self._cache_key(key), json.dumps(value), ex=self._cache_ttl)
+            self._redis.set(self._cache_key(key), _pack(value), ex=self._cache_ttl)
+
+    def _remember(self, key: str, value: List[Dict[str, Any]], expires_at: float) -> None:
+        with self._cache_lock:
+            self._cache[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX:
+                self._cache.popitem(last=False)
 
     def _request_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self._base_url}{path}"
@@ -179,14 +304,44 @@ class PlexClient:
         query.setdefault("X-Plex-Token", self._token)
         response = self._session.get(url, params=query, timeout=8)
         response.raise_for_status()
-        if "application/json" in response.headers.get("Content-Type", ""):
-            return response.json()
-        # Some Plex endpoints return XML by default; fall back to naive JSON parsing if possible.
         try:
-            return response.json()
+            return decode_json(response)
         except ValueError:  # pragma: no cover - best effort fallback
+            # Some Plex endpoints return XML by default; only declared JSON must parse.
+            if "application/json" in response.headers.get("Content-Type", ""):
+                raise
             return {}
 
+    def _iter_history(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield normalized history entries, streaming the payload when ijson is installed.
+
+        Streaming keeps only one raw item in memory at a time, and closing the
+        generator early stops reading the response body.
+        """
+
+        if ijson is None:
+            yield from self._parse_history(self._request_json(_HISTORY_PATH, params))
+            return
+        query = dict(params)
+        query.setdefault("X-Plex-Token", self._token)
+        response = self._session.get(f"{self._base_url}{_HISTORY_PATH}", params=query, timeout=8, stream=True)
+        try:
+            response.raise_for_status()
+            if "application/json" not in response.headers.get("Content-Type", ""):
+                try:
+                    payload = decode_json(response)
+                except ValueError:  # pragma: no cover - XML answer, nothing to parse
+                    return
+                yield from self._parse_history(payload)
+                return
+            response.raw.decode_content = True  # let urllib3 undo gzip before parsing
+            for item in ijson.items(response.raw, _HISTORY_ITEMS, use_float=True):
+                entry = self._normalize_entry(item)
+                if entry:
+                    yield entry
+        finally:
+            response.close()
+
     def _parse_history(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         container = payload.get("MediaContainer", {}) if isinstance(payload, dict) else {}
         metadata = container.get("Metadata", [])
@@ -198,27 +353,24 @@ class PlexClient:
         return results
 
     def _normalize_entry(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        title = item.get("title")
+        # Runs for every history row, so bind the lookup once and bail out early.
+        get = item.get
+        title = get("title")
         if not title:
             return None
-        media_type = "movie" if item.get("type") == "movie" else "show"
-        tmdb_id = self._extract_tmdb_id(item)
-        genres = [genre.get("tag") for genre in item.get("Genre", []) if genre.get("tag")]
-        networks = [studio.get("tag") for studio in item.get("Studio", []) if studio.get("tag")]
-        watchers = self._extract_watchers(item)
         return {
             "title": title,
-            "type": media_type,
-            "tmdb_id": tmdb_id,
-            "rating_key": item.get("ratingKey"),
-            "summary": item.get("summary"),
-            "genres": genres,
-            "networks": networks,
-            "runtime": self._normalize_duration(item.get("duration")),
-            "release_year": item.get("year"),
-            "watched_at": item.get("viewedAt"),
-            "in_progress": bool(item.get("viewOffset")),
-            "watchers": watchers,
+            "type": "movie" if get("type") == "movie" else "show",
+            "tmdb_id": self._extract_tmdb_id(item),
+            "rating_key": get("ratingKey"),
+            "summary": get("summary"),
+            "genres": [tag for genre in get("Genre") or () if (tag := genre.get("tag"))],
+            "networks": [tag for studio in get("Studio") or () if (tag := studio.get("tag"))],
+            "runtime": self._normalize_duration(get("duration")),
+            "release_year": get("year"),
+            "watched_at": get("viewedAt"),
+            "in_progress": bool(get("viewOffset")),
+            "watchers": self._extract_watchers(item),
             "source": "plex",
         }
 
@@ -230,35 +382,29 @@ class PlexClient:
         return ms // 60000 or None
 
     def _extract_tmdb_id(self, item: Dict[str, Any]) -> Optional[int]:
-        guids = item.get("Guid", [])
-        for guid in guids:
-            id_str = guid.get("id")
-            if not id_str:
-                continue
-            if "tmdb" in id_str:
-                try:
-                    return int(id_str.rsplit("//", 1)[-1])
-                except ValueError:
-                    continue
+        for guid in item.get("Guid") or ():
+            match = _TMDB_GUID_RE.fullmatch(guid.get("id") or "")
+            if match:
+                return int(match.group(1))
         return None
 
     def _extract_watchers(self, item: Dict[str, Any]) -> List[str]:
         watchers: List[str] = []
+        append = watchers.append
         accounts = item.get("Account")
-        if isinstance(accounts, list):
-            for account in accounts:
-                uuid = account.get("uuid") or account.get("id")
-                if uuid:
-                    watchers.append(str(uuid))
-        elif isinstance(accounts, dict):
-            uuid = accounts.get("uuid") or accounts.get("id")
+        if isinstance(accounts, dict):
+            accounts = (accounts,)
+        elif not isinstance(accounts, list):
+            accounts = ()
+        for account in accounts:
+            uuid = account.get("uuid") or account.get("id")
             if uuid:
-                watchers.append(str(uuid))
+                append(str(uuid))
         custom = item.get("User")
         if isinstance(custom, dict):
             uuid = custom.get("uuid") or custom.get("id")
             if uuid:
-                watchers.append(str(uuid))
+                append(str(uuid))
         return watchers
 
     def _entry_visible_to(self, entry: Dict[str, Any], user_uuid: str) -> bool:
@@ -275,7 +421,7 @@ class PlexClient:
                     try:
                         users = json.loads(stored)
                         return user_uuid in users
-                    except json.JSONDecodeError:
+                    except ValueError:  # includes undecodable bytes now that responses are raw
                         return False
         return False
 
@@ -1,7 +1,13 @@
 """Media recommendation pipeline integrating Plex and TMDB."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 from orchestrator.logging.event_bus import EventBus
 from services.media.plex_client import PlexClient
@@ -12,16 +18,42 @@ from services.media.tmdb_client import TMDBClient
 class MediaRecommender:
     """Combine household history with TMDB metadata to suggest content."""
 
+    # Two trending lists, continue-watching and up to ten related lookups.
+    FETCH_WORKERS = 12
+    PROFILE_TTL_SEC = 300.0
+    PROFILE_CACHE_MAX = 256
+
     def __init__(
         self,
         *,
         plex_client: PlexClient,
         tmdb_client: TMDBClient,
         event_bus: Optional[EventBus] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         self._plex = plex_client
         self._tmdb = tmdb_client
         self._event_bus = event_bus or EventBus()
+        # Only an executor created here is shut down by close().
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="halcyon-media"
+        )
+        # user_uuid -> (built_at, history fingerprint, profile), least recently used first
+        self._profile_cache: OrderedDict[str, Tuple[float, Tuple[Any, ...], FeatureWeights]] = OrderedDict()
+        self._profile_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the fetch executor if this recommender created it."""
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "MediaRecommender":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     def recommend_for_user(self, user_uuid: Optional[str], k: int = 3) -> List[Dict[str, Any]]:
@@ -31,64 +63,102 @@ class MediaRecommender:
         history_shows = self._plex.get_user_history(user_uuid, "show", limit=200)
         history: List[Dict[str, Any]] = history_movies + history_shows
         personalized = bool(user_uuid and history)
-        profile = TasteProfile(history).profile
+        profile = self._profile_for(user_uuid, history)
         watched_tmdb_ids = {item.get("tmdb_id") for item in history if item.get("tmdb_id")}
 
-        candidate_pool, candidate_sources = self._build_candidate_pool(user_uuid, history)
-        scored: List[Tuple[float, Dict[str, Any]]] = []
-        for candidate in candidate_pool:
-            tmdb_id = candidate.get("tmdb_id")
-            if tmdb_id is None or tmdb_id in watched_tmdb_ids:
-                continue
-            features = self._candidate_features(candidate)
-            score = self._score_candidate(features, profile, candidate)
+        candidate_sources: List[str] = []
+        candidates = self._iter_candidates(user_uuid, history, candidate_sources)
+        # Candidates stream straight from the fetches into a k-sized heap; only
+        # the winners get their reason rendered. Ties keep pool order, like a
+        # stable descending sort.
+        top: List[Dict[str, Any]] = []
+        for score, candidate, taste in heapq.nlargest(
+            k, self._scored(candidates, profile, watched_tmdb_ids), key=itemgetter(0)
+        ):
             candidate["score"] = score
-            candidate["reason"] = TasteProfile.explain(features, profile)
+            candidate["reason"] = TasteProfile.explain_features(taste, profile)
             candidate["personalized"] = personalized
-            scored.append((score, candidate))
-        scored.sort(key=lambda item: item[0], reverse=True)
-        top = [item for _, item in scored[:k]]
+            top.append(candidate)
         self._event_bus.publish(
             "media/recommendation",
             {
                 "uuid": user_uuid,
                 "n_options": len(top),
-                "sources": sorted(candidate_sources),
+                "sources": sorted(set(candidate_sources)),
             },
         )
         return top
 
+    def recommend_for_users(
+        self, user_uuids: Sequence[Optional[str]], k: int = 3
+    ) -> Dict[Optional[str], List[Dict[str, Any]]]:
+        """Return the top ``k`` recommendations for each of ``user_uuids``.
+
+        Cached histories for the whole batch are loaded from Redis up front,
+        one round-trip per history kind instead of one per user.
+        """
+
+        for kind in ("movie", "show"):
+            self._plex.prefetch_users(user_uuids, kind, limit=200)
+        return {user_uuid: self.recommend_for_user(user_uuid, k=k) for user_uuid in user_uuids}
+
     def format_spoken(self, options: Sequence[Dict[str, Any]], persona: str) -> str:
         """Generate persona-aligned spoken summary for the provided options."""
 
         if not options:
             return "I couldn't find anything suitable right now."
-        personalized = any(option.get("personalized") for option in options)
-        if persona.upper() == "SCARLET":
-            header = "Three candidates." if options else "No candidates."  # pragma: no cover - guard
+        persona_key = persona.upper()
+        halston = persona_key == "HALSTON"
+        scarlet = persona_key == "SCARLET"
+        if scarlet:
+            header = "Three candidates."
+        elif any(option.get("personalized") for option in options):
+            header = "Based on your recent habits, here are three options."
         else:
-            header = (
-                "Based on your recent habits, here are three options."
-                if personalized
-                else "Here are three popular options worth a look."
-            )
+            header = "Here are three popular options worth a look."
         parts = [header]
         for idx, option in enumerate(options, start=1):
             title = option.get("title", "")
             reason = option.get("reason", "")
-            snippet = f"{idx}: {title}" if persona.upper() == "HALSTON" else f"{title}"
-            if persona.upper() == "HALSTON" and reason:
-                snippet = f"{snippet} — {reason}".strip()
-            elif persona.upper() == "SCARLET" and reason:
-                snippet = f"{snippet}. {reason}".strip()
+            if halston:
+                snippet = f"{idx}: {title} — {reason}".strip() if reason else f"{idx}: {title}"
+            elif scarlet and reason:
+                snippet = f"{title}. {reason}".strip()
+            else:
+                snippet = f"{title}"
             parts.append(snippet)
-        if persona.upper() == "HALSTON":
-            parts.append("Which would you like?")
-        else:
-            parts.append("Choose one.")
+        parts.append("Which would you like?" if halston else "Choose one.")
         return " ".join(part for part in parts if part)
 
     # ------------------------------------------------------------------
+    def _profile_for(self, user_uuid: Optional[str], history: Sequence[Dict[str, Any]]) -> FeatureWeights:
+        """Return the taste profile, reusing the last one while the history looks unchanged."""
+
+        if not user_uuid or not history:
+            return TasteProfile(history).profile
+        first, last = history[0], history[-1]
+        fingerprint = (
+            len(history),
+            first.get("rating_key"),
+            first.get("watched_at"),
+            last.get("rating_key"),
+            last.get("watched_at"),
+        )
+        now = time.monotonic()
+        cache = self._profile_cache
+        with self._profile_lock:
+            cached = cache.get(user_uuid)
+            if cached is not None and cached[1] == fingerprint and now - cached[0] < self.PROFILE_TTL_SEC:
+                cache.move_to_end(user_uuid)
+                return cached[2]
+        profile = TasteProfile(history).profile
+        with self._profile_lock:
+            cache[user_uuid] = (now, fingerprint, profile)
+            cache.move_to_end(user_uuid)
+            while len(cache) > self.PROFILE_CACHE_MAX:
+                cache.popitem(last=False)
+        return profile
+
     def _candidate_features(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
         genres = candidate.get("genre_ids") or candidate.get("genres") or []
         if isinstance(genres, list) and genres and isinstance(genres[0], dict):
@@ -108,33 +178,62 @@ class MediaRecommender:
 
     def _score_candidate(
         self,
-        candidate_features: Dict[str, Any],
+        taste_features: Mapping[str, float],
         profile: FeatureWeights,
         candidate: Dict[str, Any],
     ) -> float:
-        base = TasteProfile.score(candidate_features, profile)
+        base = TasteProfile.score_features(taste_features, profile)
         novelty = 0.1 if candidate.get("popularity", 0) < 10 else 0.0
         source_bonus = 0.2 if candidate.get("source") == "continue" else 0.0
         score = base + novelty + source_bonus
         return max(0.0, min(1.0, score))
 
-    def _build_candidate_pool(
+    def _scored(
+        self,
+        candidates: Iterable[Dict[str, Any]],
+        profile: FeatureWeights,
+        watched_tmdb_ids: Set[Any],
+    ) -> Iterator[Tuple[float, Dict[str, Any], Dict[str, float]]]:
+        """Yield ``(score, candidate, taste features)`` for every unwatched candidate."""
+
+        for candidate in candidates:
+            tmdb_id = candidate.get("tmdb_id")
+            if tmdb_id is None or tmdb_id in watched_tmdb_ids:
+                continue
+            # Features are kept so the winners' reasons reuse them.
+            taste = TasteProfile.features(self._candidate_features(candidate))
+            yield self._score_candidate(taste, profile, candidate), candidate, taste
+
+    def _iter_candidates(
         self,
         user_uuid: Optional[str],
         history: Sequence[Dict[str, Any]],
-    ) -> Tuple[List[Dict[str, Any]], List[str]]:
-        pool: List[Dict[str, Any]] = []
-        sources: List[str] = []
+        sources: List[str],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the candidate pool, appending each contributing source to ``sources``."""
 
-        for type_name in ("movie", "tv"):
-            for entry in self._tmdb.trending(type_name):
-                pool.append(self._normalize_tmdb(entry, type_name, source="trending"))
+        # Every upstream call is independent, so issue them all before reading
+        # any result; results are consumed in submission order to keep the
+        # pool (and therefore tie-breaking between equal scores) deterministic.
+        submit = self._executor.submit
+        trending = [(type_name, submit(self._tmdb.trending, type_name)) for type_name in ("movie", "tv")]
+        continue_future = submit(self._plex.get_continue_watching, user_uuid) if user_uuid else None
+        related_futures = []
+        if user_uuid:
+            top_history = [item for item in history if item.get("tmdb_id")][:10]
+            for item in top_history:
+                type_name = item.get("type", "movie")
+                related_futures.append((type_name, submit(self._tmdb.recommendations, item["tmdb_id"], type_name)))
+
+        for type_name, future in trending:
+            for entry in future.result():
+                yield self._normalize_tmdb(entry, type_name, source="trending")
             sources.append("trending")
 
-        if user_uuid:
-            continue_list = self._plex.get_continue_watching(user_uuid)
+        if continue_future is not None:
+            continue_list = continue_future.result()
             for item in continue_list:
-                normalized = {
+                yield {
                     "tmdb_id": item.get("tmdb_id"),
                     "type": item.get("type", "movie"),
                     "title": item.get("title"),
@@ -144,21 +243,15 @@ class MediaRecommender:
                     "genres": item.get("genres", []),
                     "source": "continue",
                 }
-                pool.append(normalized)
             if continue_list:
                 sources.append("continue")
 
-            top_history = [item for item in history if item.get("tmdb_id")] [:10]
-            for item in top_history:
-                tmdb_id = item.get("tmdb_id")
-                if not tmdb_id:
-                    continue
-                related = self._tmdb.recommendations(tmdb_id, item.get("type", "movie"))
-                for candidate in related[:5]:
-                    pool.append(self._normalize_tmdb(candidate, item.get("type", "movie"), source="related"))
-                if related:
-                    sources.append("related")
-        return pool, list(dict.fromkeys(sources))
+        for type_name, future in related_futures:
+            related = future.result()
+            for candidate in related[:5]:
+                yield self._normalize_tmdb(candidate, type_name, source="related")
+            if related:
+                sources.append("related")
 
     def _normalize_tmdb(self, item: Dict[str, Any], type_name: str, *, source: str) -> Dict[str, Any]:
         title = item.get("title") or item.get("name")
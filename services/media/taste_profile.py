@@ -1,12 +1,26 @@
 """Lightweight taste profiling and scoring utilities."""
 from __future__ import annotations
 
-from collections import Counter
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 
 FeatureWeights = Dict[str, float]
 
+# Bucket upper bounds (exclusive) and the name for each interval.
+_RUNTIME_BOUNDS = (30, 60, 110)
+_RUNTIME_NAMES = ("short", "medium", "feature", "epic")
+_RELEASE_BOUNDS = (2000, 2010, 2020)
+_RELEASE_NAMES = ("classic", "mid", "recent", "new")
+
+
+@lru_cache(maxsize=8192)
+def _feat_key(kind: str, value: str) -> str:
+    """Return the ``kind:value`` feature key; the vocabulary is small, so hits dominate."""
+
+    return f"{kind}:{value.lower()}"
+
 
 class TasteProfile:
     """Constructs and evaluates household viewing preferences."""
@@ -18,7 +32,7 @@ class TasteProfile:
     # ------------------------------------------------------------------
     @staticmethod
     def _build_profile(history: Sequence[Mapping[str, object]]) -> FeatureWeights:
-        features: Counter[str] = Counter()
+        features: Dict[str, float] = {}
         for item in history:
             TasteProfile._ingest_item(features, item)
         total = sum(features.values())
@@ -27,22 +41,29 @@ class TasteProfile:
         return {feature: count / total for feature, count in features.items()}
 
     @staticmethod
-    def _ingest_item(features: Counter[str], item: Mapping[str, object]) -> None:
+    def _ingest_item(features: Dict[str, float], item: Mapping[str, object]) -> None:
+        # Plain dict get/set: this runs per history item and per candidate, and
+        # Counter's __missing__ path is measurably slower.
+        get = features.get
         genres = item.get("genres") or []
         for genre in genres:
-            features[f"genre:{str(genre).lower()}"] += 1
+            key = _feat_key("genre", str(genre))
+            features[key] = get(key, 0) + 1
 
         networks = item.get("networks") or []
         for network in networks:
-            features[f"network:{str(network).lower()}"] += 0.5
+            key = _feat_key("network", str(network))
+            features[key] = get(key, 0) + 0.5
 
         runtime = TasteProfile._runtime_bucket(item.get("runtime"))
         if runtime:
-            features[f"pace:{runtime}"] += 0.4
+            key = _feat_key("pace", runtime)
+            features[key] = get(key, 0) + 0.4
 
         release = TasteProfile._release_bucket(item.get("release_year"))
         if release:
-            features[f"year:{release}"] += 0.6
+            key = _feat_key("year", release)
+            features[key] = get(key, 0) + 0.6
 
     @staticmethod
     def _runtime_bucket(runtime: object) -> Optional[str]:
@@ -50,13 +71,7 @@ class TasteProfile:
             minutes = int(runtime)
         except (TypeError, ValueError):
             return None
-        if minutes < 30:
-            return "short"
-        if minutes < 60:
-            return "medium"
-        if minutes < 110:
-            return "feature"
-        return "epic"
+        return _RUNTIME_NAMES[bisect_right(_RUNTIME_BOUNDS, minutes)]
 
     @staticmethod
     def _release_bucket(year: object) -> Optional[str]:
@@ -64,21 +79,31 @@ class TasteProfile:
             y = int(year)
         except (TypeError, ValueError):
             return None
-        if y < 2000:
-            return "classic"
-        if y < 2010:
-            return "mid"
-        if y < 2020:
-            return "recent"
-        return "new"
+        return _RELEASE_NAMES[bisect_right(_RELEASE_BOUNDS, y)]
 
     # ------------------------------------------------------------------
+    @staticmethod
+    def features(candidate: Mapping[str, object]) -> Dict[str, float]:
+        """Return the weighted feature set of ``candidate``.
+
+        Callers that both score and explain a candidate can extract features
+        once and use :meth:`score_features` / :meth:`explain_features`.
+        """
+
+        candidate_features: Dict[str, float] = {}
+        TasteProfile._ingest_item(candidate_features, candidate)
+        return candidate_features
+
     @staticmethod
     def score(candidate: Mapping[str, object], profile: FeatureWeights) -> float:
         if not profile:
             return 0.5
-        candidate_features = Counter[str]()
-        TasteProfile._ingest_item(candidate_features, candidate)
+        return TasteProfile.score_features(TasteProfile.features(candidate), profile)
+
+    @staticmethod
+    def score_features(candidate_features: Mapping[str, float], profile: FeatureWeights) -> float:
+        if not profile:
+            return 0.5
         if not candidate_features:
             return 0.3
         numerator = sum(profile.get(feature, 0.0) for feature in candidate_features.keys())
@@ -88,8 +113,12 @@ class TasteProfile:
     def explain(candidate: Mapping[str, object], profile: FeatureWeights) -> str:
         if not profile:
             return "These are popular picks right now."
-        candidate_features = Counter[str]()
-        TasteProfile._ingest_item(candidate_features, candidate)
+        return TasteProfile.explain_features(TasteProfile.features(candidate), profile)
+
+    @staticmethod
+    def explain_features(candidate_features: Mapping[str, float], profile: FeatureWeights) -> str:
+        if not profile:
+            return "These are popular picks right now."
         scored = [
             (profile.get(feature, 0.0), feature)
             for feature in candidate_features.keys()
@@ -1,13 +1,16 @@
 """Minimal TMDB API helper for metadata enrichment."""
 from __future__ import annotations
 
-import json
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import requests
 
+from services.media.http_session import decode_json, pooled_session
+
 
 @dataclass(slots=True)
 class _CacheEntry:
@@ -19,20 +22,31 @@ class TMDBClient:
     """Fetch metadata, trending lists, and recommendations from TMDB."""
 
     BASE_URL = "https://api.themoviedb.org/3"
+    # Per-endpoint lifetimes: title details barely change, trending lists churn,
+    # and empty answers are retried soon in case they were transient.
+    DETAILS_TTL = 3600
+    RECOMMENDATIONS_TTL = 1800
+    TRENDING_TTL = 300
+    EMPTY_TTL = 60
+    DEFAULT_TTL = 600
+    CACHE_MAX = 1024
 
     def __init__(
         self,
         *,
         api_key: str,
         session: Optional[requests.Session] = None,
-        cache_ttl: int = 600,
+        cache_ttl: Optional[int] = None,
     ) -> None:
         if not api_key:
             raise ValueError("TMDBClient requires an API key")
         self._api_key = api_key
-        self._session = session or requests.Session()
+        self._session = session or pooled_session()
+        # Upper bound on every cached lifetime; None keeps the per-endpoint TTLs.
         self._cache_ttl = cache_ttl
-        self._cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], _CacheEntry] = {}
+        self._cache: OrderedDict[Tuple[str, Tuple[Tuple[str, Any], ...]], _CacheEntry] = OrderedDict()
+        self._cache_lock = threading.Lock()  # recommender fetches share the client across threads
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], threading.Event] = {}
 
     # ------------------------------------------------------------------
     def details(self, tmdb_id: int, type: Literal["movie", "tv"]) -> Dict[str, Any]:
@@ -48,23 +62,67 @@ class TMDBClient:
 
     # ------------------------------------------------------------------
     def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        cache_key = self._cache_key(path, params or {})
-        cached = self._cache.get(cache_key)
-        now = time.time()
-        if cached and cached.expires_at > now:
-            return cached.value
+        cache_key = self._cache_key(path, params)
+        while True:
+            now = time.time()
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached and cached.expires_at > now:
+                    self._cache.move_to_end(cache_key)
+                    return cached.value
+                # Single flight: the first caller fetches, concurrent callers for
+                # the same key wait for it and then re-read the cache.
+                inflight = self._inflight.get(cache_key)
+                if inflight is None:
+                    inflight = self._inflight[cache_key] = threading.Event()
+                    break
+            inflight.wait()
+            # If the leader failed nothing was cached; loop round and fetch ourselves.
+
+        try:
+            data = self._fetch(path, params)
+            entry = _CacheEntry(value=data, expires_at=now + self._ttl_for(path, data))
+            with self._cache_lock:
+                self._cache[cache_key] = entry
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.CACHE_MAX:
+                    self._cache.popitem(last=False)
+            return data
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(cache_key, None)
+            inflight.set()
+
+    def _fetch(self, path: str, params: Optional[Dict[str, Any]]) -> Any:
         url = f"{self.BASE_URL}{path}"
         query = dict(params or {})
         query.setdefault("api_key", self._api_key)
         response = self._session.get(url, params=query, timeout=8)
         response.raise_for_status()
-        data = response.json() if response.content else {}
-        self._cache[cache_key] = _CacheEntry(value=data, expires_at=now + self._cache_ttl)
-        return data
+        return decode_json(response)
+
+    def _ttl_for(self, path: str, data: Any) -> int:
+        ttl = self._endpoint_ttl(path, data)
+        return ttl if self._cache_ttl is None else min(ttl, self._cache_ttl)
+
+    def _endpoint_ttl(self, path: str, data: Any) -> int:
+        if not data or (isinstance(data, dict) and "results" in data and not data["results"]):
+            return self.EMPTY_TTL
+        if path.startswith("/trending/"):
+            return self.TRENDING_TTL
+        if path.endswith("/recommendations"):
+            return self.RECOMMENDATIONS_TTL
+        if path.count("/") == 2 and path.startswith(("/movie/", "/tv/")):
+            return self.DETAILS_TTL
+        return self.DEFAULT_TTL
 
-    def _cache_key(self, path: str, params: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
-        key_items = tuple(sorted(params.items()))
-        return path, key_items
+    def _cache_key(
+        self, path: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        # Every public helper calls without params, so skip the sort for them.
+        if not params:
+            return path, ()
+        return path, tuple(sorted(params.items()))
 
 
 __all__ = ["TMDBClient"]
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 import redis
 
+from orchestrator.context.redis_pool import get_client
 from orchestrator.logging.event_bus import EventBus
 from services.voice_pipeline.room_registry import RoomRegistry
 
@@ -14,6 +17,12 @@ from services.voice_pipeline.room_registry import RoomRegistry
 class ConversationRouter:
     """Routes conversations to appropriate rooms with follow-me handoff support."""
 
+    # How long select_active_room trusts its in-process copy of a speaker's
+    # room lock and last room; local writes invalidate it immediately.
+    ROOM_STATE_TTL_SEC = 1.0
+    # Most speakers kept in that copy; the least recently used is evicted.
+    ROOM_STATE_CACHE_MAX = 1024
+
     def __init__(
         self,
         room_registry: RoomRegistry,
@@ -42,7 +51,11 @@ class ConversationRouter:
         """
         self._room_registry = room_registry
         self._event_bus = event_bus or EventBus()
-        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self._redis = get_client(redis_url)
+        # uuid -> (fetched_at monotonic, locked_room, last_room)
+        self._room_state_cache: OrderedDict[str, Tuple[float, Optional[str], Optional[str]]] = OrderedDict()
+        # Wake callbacks and handoffs run on different threads.
+        self._room_state_lock = threading.Lock()
 
         gap_env = follow_me_max_gap_sec
         if gap_env is None:
@@ -66,6 +79,40 @@ class ConversationRouter:
         """Redis key for manual room lock."""
         return f"halcyon:voice:room_lock:{uuid}"
 
+    def _room_state(self, uuid: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (locked_room, last_room), served from a short-lived local copy."""
+        now = time.monotonic()
+        cache = self._room_state_cache
+        with self._room_state_lock:
+            cached = cache.get(uuid)
+            if cached is not None and now - cached[0] < self.ROOM_STATE_TTL_SEC:
+                cache.move_to_end(uuid)
+                return cached[1], cached[2]
+        locked_room, last_room = self._redis.mget(self._key_room_lock(uuid), self._key_last_room(uuid))
+        with self._room_state_lock:
+            cache[uuid] = (now, locked_room, last_room)
+            cache.move_to_end(uuid)
+            while len(cache) > self.ROOM_STATE_CACHE_MAX:
+                cache.popitem(last=False)
+        return locked_room, last_room
+
+    def _invalidate_room_state(self, uuid: str) -> None:
+        """Drop the local copy of a speaker's room state after a local write."""
+        with self._room_state_lock:
+            self._room_state_cache.pop(uuid, None)
+
+    def _store_last_room(self, uuid: str, room_id: str, now: float) -> None:
+        """Write last room and last seen in a single round-trip.
+
+        ``now`` is wall-clock time: last_seen is shared with other processes
+        through Redis, where a monotonic reading would be meaningless.
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(self._key_last_room(uuid), room_id, ex=3600)
+        pipe.set(self._key_last_seen(uuid), str(now), ex=3600)
+        pipe.execute()
+        self._invalidate_room_state(uuid)
+
     def select_active_room(
         self,
         uuid: Optional[str],
@@ -89,10 +136,10 @@ class ConversationRouter:
         """
         now = time.time()
 
-        # Check for manual room lock
+        # Read the manual room lock and last room in one round-trip
+        locked_room = last_room = None
         if uuid:
-            lock_key = self._key_room_lock(uuid)
-            locked_room = self._redis.get(lock_key)
+            locked_room, last_room = self._room_state(uuid)
             if locked_room:
                 return locked_room
 
@@ -102,17 +149,14 @@ class ConversationRouter:
             if room:
                 # Update last room and timestamp
                 if uuid:
-                    self._redis.set(self._key_last_room(uuid), last_room_hint, ex=3600)
-                    self._redis.set(self._key_last_seen(uuid), str(now), ex=3600)
+                    self._store_last_room(uuid, last_room_hint, now)
                 return last_room_hint
 
         # Fall back to last room from Redis
-        if uuid:
-            last_room = self._redis.get(self._key_last_room(uuid))
-            if last_room:
-                room = self._room_registry.get_room(last_room)
-                if room:
-                    return last_room
+        if last_room:
+            room = self._room_registry.get_room(last_room)
+            if room:
+                return last_room
 
         # Default to default room or first available
         default = self._room_registry.get_default_room()
@@ -147,56 +191,64 @@ class ConversationRouter:
             return None
 
         now = time.time()
-
-        # Get last seen timestamp
         last_seen_key = self._key_last_seen(uuid)
-        last_seen_raw = self._redis.get(last_seen_key)
-        if not last_seen_raw:
-            return None
-
-        try:
-            last_seen = float(last_seen_raw)
-        except (ValueError, TypeError):
-            return None
-
-        # Check if within follow-me window
-        gap = now - last_seen
-        if gap > self._follow_me_max_gap:
-            return None
-
-        # Get last room
         last_room_key = self._key_last_room(uuid)
-        last_room = self._redis.get(last_room_key)
-        if not last_room:
-            return None
 
-        # Find best candidate room (highest confidence, not last room)
-        best_room = None
-        best_conf = 0.0
-        for room_id, confidence in candidate_rooms:
-            if room_id != last_room and confidence >= self._handoff_min_confidence:
-                if confidence > best_conf:
-                    best_conf = confidence
-                    best_room = room_id
+        with self._redis.pipeline(transaction=True) as pipe:
+            # Watch the state the decision is based on: if a concurrent wake
+            # event moves the speaker first, our handoff is dropped instead of
+            # overwriting theirs.
+            pipe.watch(last_seen_key, last_room_key)
+            last_seen_raw, last_room = pipe.mget(last_seen_key, last_room_key)
+            if not last_seen_raw:
+                return None
+
+            try:
+                last_seen = float(last_seen_raw)
+            except (ValueError, TypeError):
+                return None
+
+            # Check if within follow-me window
+            gap = now - last_seen
+            if gap > self._follow_me_max_gap:
+                return None
+
+            if not last_room:
+                return None
+
+            # Find best candidate room (highest confidence, not last room)
+            best_room = None
+            best_conf = 0.0
+            for room_id, confidence in candidate_rooms:
+                if room_id != last_room and confidence >= self._handoff_min_confidence:
+                    if confidence > best_conf:
+                        best_conf = confidence
+                        best_room = room_id
+
+            if not best_room:
+                return None
 
-        if best_room:
             # Update state
-            self._redis.set(self._key_last_room(uuid), best_room, ex=3600)
-            self._redis.set(self._key_last_seen(uuid), str(now), ex=3600)
-
-            # Publish handoff event
-            self._event_bus.publish(
-                "voice/handoff",
-                {
-                    "uuid": uuid,
-                    "from": last_room,
-                    "to": best_room,
-                    "confidence": round(best_conf, 3),
-                },
-            )
-            return best_room
-
-        return None
+            pipe.multi()
+            pipe.set(last_room_key, best_room, ex=3600)
+            pipe.set(last_seen_key, str(now), ex=3600)
+            try:
+                pipe.execute()
+            except redis.WatchError:
+                return None
+        self._invalidate_room_state(uuid)
+
+        # Publish handoff event
+        self._event_bus.publish(
+            "voice/handoff",
+            {
+                "uuid": uuid,
+                "from": last_room,
+                "to": best_room,
+                "confidence": round(best_conf, 3),
+            },
+        )
+        return best_room
 
     def can_speak_in(self, room_id: str, persona: str = "HALSTON") -> bool:
         """Check if speech output is allowed in a room.
@@ -213,12 +265,17 @@ class ConversationRouter:
         -------
         True if speech is allowed, False otherwise.
         """
+        return self.profile_allows_speech(self._room_registry.get_profile(room_id), persona)
+
+    @staticmethod
+    def profile_allows_speech(profile: Dict, persona: str = "HALSTON") -> bool:
+        """Apply the :meth:`can_speak_in` rules to a ``RoomRegistry.get_profile`` dict."""
         # Privacy zones always deny speech
-        if self._room_registry.is_privacy_zone(room_id):
+        if profile["privacy"]:
             return False
 
         # DND zones deny speech unless SCARLET critical
-        if self._room_registry.is_dnd_zone(room_id):
+        if profile["dnd"]:
             # SCARLET can override DND for critical announcements
             # (This is a simplified check; actual implementation might check
             # for specific intent types or threat levels)
@@ -248,6 +305,10 @@ class ConversationRouter:
     def set_room_lock(self, uuid: str, room_id: Optional[str]) -> None:
         """Manually lock a speaker to a specific room.
 
+        An existing lock is overwritten, so this also moves a lock between
+        rooms. Use :meth:`try_acquire_room_lock` when concurrent handoffs must
+        not replace each other's lock.
+
         Parameters
         ----------
         uuid:
@@ -260,6 +321,41 @@ class ConversationRouter:
             self._redis.set(lock_key, room_id, ex=3600)
         else:
             self._redis.delete(lock_key)
+        self._invalidate_room_state(uuid)
+
+    def try_acquire_room_lock(self, uuid: str, room_id: str) -> bool:
+        """Lock a speaker to ``room_id`` only if no lock exists (``SET NX``).
+
+        Returns
+        -------
+        True if the lock was taken, False if one was already held.
+        """
+        acquired = bool(self._redis.set(self._key_room_lock(uuid), room_id, ex=3600, nx=True))
+        if acquired:
+            self._invalidate_room_state(uuid)
+        return acquired
+
+    def release_room_lock(self, uuid: str, room_id: str) -> bool:
+        """Remove a speaker's room lock only if it still points at ``room_id``.
+
+        Returns
+        -------
+        True if the lock was released, False if it was missing or held for
+        another room.
+        """
+        lock_key = self._key_room_lock(uuid)
+        with self._redis.pipeline(transaction=True) as pipe:
+            pipe.watch(lock_key)
+            if pipe.get(lock_key) != room_id:
+                return False
+            pipe.multi()
+            pipe.delete(lock_key)
+            try:
+                pipe.execute()
+            except redis.WatchError:
+                return False
+        self._invalidate_room_state(uuid)
+        return True
 
     def update_last_room(self, uuid: Optional[str], room_id: str) -> None:
         """Update the last room used by a speaker.
@@ -273,9 +369,7 @@ class ConversationRouter:
         """
         if not uuid:
             return
-        now = time.time()
-        self._redis.set(self._key_last_room(uuid), room_id, ex=3600)
-        self._redis.set(self._key_last_seen(uuid), str(now), ex=3600)
+        self._store_last_room(uuid, room_id, time.time())
 
         # Publish active room event
         self._event_bus.publish(
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, FrozenSet, Optional, Set
 
 from orchestrator.logging.event_bus import EventBus
 from services.voice_pipeline.room_registry import RoomRegistry
@@ -17,6 +17,9 @@ _LOGGER = logging.getLogger(__name__)
 class InputMux:
     """Multiplexes audio input from multiple microphones to STT engine."""
 
+    # Streaming mics report their "stt" state at most this often.
+    STREAM_STATE_INTERVAL_SEC = 1.0
+
     def __init__(
         self,
         stt_engine: STTEngine,
@@ -48,9 +51,21 @@ class InputMux:
         self._event_bus = event_bus or EventBus()
         self._wakeword_listener = wakeword_listener
 
-        # Track active sessions: mic_id -> (uuid, temp_id, start_time)
+        # Track active sessions: mic_id -> (uuid, temp_id, monotonic start_time).
+        # Copy-on-write: writers build a new dict under the lock and swap it in,
+        # so readers (including the per-frame push path) never take the lock.
         self._active_sessions: Dict[str, tuple[Optional[str], str, float]] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+
+        # A session's first frame publishes its "stt" state at once; later frames
+        # only mark the mic dirty and a long-lived flusher coalesces them.
+        # _streaming is copy-on-write like _active_sessions. _dirty_mics is
+        # added to without the lock and swapped out whole by the flusher; a mark
+        # lost to that race is set again by the mic's next frame.
+        self._streaming: FrozenSet[str] = frozenset()
+        self._dirty_mics: Set[str] = set()
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
 
         # Subscribe to wakeword events
         self._wakeword_bus.subscribe(self._on_wake_event)
@@ -76,7 +91,10 @@ class InputMux:
                     break
 
             # Activate this mic
-            self._active_sessions[mic_id] = (None, temp_id, time.time())
+            sessions = dict(self._active_sessions)
+            sessions[mic_id] = (None, temp_id, time.monotonic())
+            self._active_sessions = sessions
+            self._streaming = self._streaming - {mic_id}
 
             # Update stream state
             self._event_bus.publish(
@@ -105,19 +123,16 @@ class InputMux:
             _LOGGER.debug("Dropping malformed frame from mic %s (size: %d)", mic_id, len(frame_20ms))
             return
 
-        with self._lock:
-            # Check if this mic has an active session
-            session = self._active_sessions.get(mic_id)
-            if not session:
-                # No active session - pass to wakeword listener only
-                if self._wakeword_listener:
-                    try:
-                        self._wakeword_listener(frame_20ms)
-                    except Exception:
-                        _LOGGER.exception("Wakeword listener error")
-                return
-
-            uuid, temp_id, start_time = session
+        # Check if this mic has an active session (lock-free snapshot read)
+        session = self._active_sessions.get(mic_id)
+        if not session:
+            # No active session - pass to wakeword listener only
+            if self._wakeword_listener:
+                try:
+                    self._wakeword_listener(frame_20ms)
+                except Exception:
+                    _LOGGER.exception("Wakeword listener error")
+            return
 
         # Active session exists - route to STT
         try:
@@ -125,9 +140,11 @@ class InputMux:
         except Exception:
             _LOGGER.exception("STT push error for mic %s", mic_id)
 
-        # Update stream state (throttled to avoid spam)
-        now = time.time()
-        if now - start_time < 0.1 or int(now * 10) % 10 == 0:  # Update every 100ms or so
+        # Stream state is coalesced off the audio path
+        if mic_id in self._streaming:
+            self._dirty_mics.add(mic_id)
+        elif self._start_streaming(mic_id):
+            uuid, temp_id, _ = session
             self._event_bus.publish(
                 "voice/stream_state",
                 {
@@ -138,6 +155,60 @@ class InputMux:
                 },
             )
 
+    def _start_streaming(self, mic_id: str) -> bool:
+        """Mark ``mic_id`` as streaming; return True for the session's first frame."""
+        with self._lock:
+            if mic_id in self._streaming:
+                return False
+            self._streaming = self._streaming | {mic_id}
+            if self._flusher is None:
+                self._stop.clear()
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="halcyon-stream-state", daemon=True
+                )
+                self._flusher.start()
+            return True
+
+    def stop(self) -> None:
+        """Stop the background stream_state flusher."""
+        self._stop.set()
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=2.0)
+        self._flush_stream_state()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.STREAM_STATE_INTERVAL_SEC):
+            self._flush_stream_state()
+
+    def _flush_stream_state(self) -> None:
+        """Publish one "stt" stream_state per mic that streamed since the last flush."""
+        if not self._dirty_mics:
+            return
+        dirty, self._dirty_mics = self._dirty_mics, set()
+        sessions = self._active_sessions
+        events = []
+        # tuple() snapshots in one step; a frame may still add to the old set.
+        for mic_id in tuple(dirty):
+            session = sessions.get(mic_id)
+            if session is None:
+                continue  # released since its last frame
+            uuid, temp_id, _ = session
+            events.append(
+                (
+                    "voice/stream_state",
+                    {
+                        "mic_id": mic_id,
+                        "state": "stt",
+                        "uuid": uuid,
+                        "temp_id": temp_id,
+                    },
+                )
+            )
+        if events:
+            self._event_bus.publish_many(events)
+
     def release_session(self, mic_id: str) -> None:
         """Release an active microphone session (end of utterance).
 
@@ -148,7 +219,11 @@ class InputMux:
         """
         with self._lock:
             if mic_id in self._active_sessions:
-                del self._active_sessions[mic_id]
+                sessions = dict(self._active_sessions)
+                del sessions[mic_id]
+                self._active_sessions = sessions
+                self._streaming = self._streaming - {mic_id}
+                self._dirty_mics.discard(mic_id)
                 self._event_bus.publish(
                     "voice/stream_state",
                     {
@@ -171,7 +246,9 @@ class InputMux:
         with self._lock:
             if mic_id in self._active_sessions:
                 _, temp_id, start_time = self._active_sessions[mic_id]
-                self._active_sessions[mic_id] = (uuid, temp_id, start_time)
+                sessions = dict(self._active_sessions)
+                sessions[mic_id] = (uuid, temp_id, start_time)
+                self._active_sessions = sessions
                 _LOGGER.debug("Updated UUID for mic %s: %s", mic_id, uuid)
 
     def get_active_mic_for_uuid(self, uuid: Optional[str]) -> Optional[str]:
@@ -186,11 +263,10 @@ class InputMux:
         -------
         Microphone ID if found, None otherwise.
         """
-        with self._lock:
-            for mic_id, (session_uuid, _, _) in self._active_sessions.items():
-                if session_uuid == uuid:
-                    return mic_id
-            return None
+        for mic_id, (session_uuid, _, _) in self._active_sessions.items():
+            if session_uuid == uuid:
+                return mic_id
+        return None
 
     def get_temp_id_for_mic(self, mic_id: str) -> Optional[str]:
         """Get the temporary session ID for a microphone.
@@ -204,11 +280,10 @@ class InputMux:
         -------
         Temporary session ID if mic is active, None otherwise.
         """
-        with self._lock:
-            session = self._active_sessions.get(mic_id)
-            if session:
-                return session[1]  # temp_id
-            return None
+        session = self._active_sessions.get(mic_id)
+        if session:
+            return session[1]  # temp_id
+        return None
 
 
 __all__ = ["InputMux"]
@@ -12,7 +12,11 @@ from orchestrator.logging.event_bus import EventBus
 
 @dataclass
 class MicStatus:
-    """Status information for a microphone."""
+    """Status information for a microphone.
+
+    ``last_heartbeat`` is a :func:`time.monotonic` reading, so liveness
+    timeouts are immune to wall-clock adjustments.
+    """
 
     mic_id: str
     room_id: str
@@ -26,6 +30,10 @@ class MicStatus:
 class MicManager:
     """Manages microphone registration and health tracking."""
 
+    # How often the background monitor flushes heartbeats and publishes
+    # alive/dead transitions.
+    MONITOR_INTERVAL_SEC = 1.0
+
     def __init__(
         self,
         *,
@@ -49,7 +57,11 @@ class MicManager:
         self._heartbeat_timeout = timeout_env
 
         self._mics: Dict[str, MicStatus] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # Latest heartbeat payload per mic, published in one batch per monitor tick
+        self._pending_heartbeats: Dict[str, Dict] = {}
+        self._monitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
 
     def register_mic(self, mic_id: str, room_id: str, device: str, caps: Optional[Dict] = None) -> None:
         """Register a microphone with the manager.
@@ -66,7 +78,7 @@ class MicManager:
             Optional capabilities dictionary (reserved for future use).
         """
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             self._mics[mic_id] = MicStatus(
                 mic_id=mic_id,
                 room_id=room_id,
@@ -76,6 +88,40 @@ class MicManager:
                 vad_active=False,
                 alive=True,
             )
+            if self._monitor is None:
+                self._stop.clear()
+                self._monitor = threading.Thread(target=self._monitor_loop, name="halcyon-mic-monitor", daemon=True)
+                self._monitor.start()
+
+    def stop(self) -> None:
+        """Stop the background liveness monitor."""
+        self._stop.set()
+        with self._lock:
+            monitor, self._monitor = self._monitor, None
+        if monitor is not None and monitor is not threading.current_thread():
+            monitor.join(timeout=2.0)
+        self.flush_heartbeats()
+
+    def _monitor_loop(self) -> None:
+        while not self._stop.wait(self.MONITOR_INTERVAL_SEC):
+            self.flush_heartbeats()
+            self.sweep()
+
+    def flush_heartbeats(self) -> None:
+        """Publish the latest pending heartbeat of every mic as one batch."""
+        with self._lock:
+            if not self._pending_heartbeats:
+                return
+            pending = list(self._pending_heartbeats.values())
+            self._pending_heartbeats.clear()
+        self._event_bus.publish_many(("voice/mic/heartbeat", payload) for payload in pending)
+
+    def sweep(self) -> None:
+        """Re-evaluate every mic's liveness and publish alive/dead transitions."""
+        with self._lock:
+            now = time.monotonic()
+            for status in self._mics.values():
+                self._refresh_alive(status, now)
 
     def heartbeat(self, mic_id: str, rms_level: float, vad: bool) -> None:
         """Update microphone heartbeat with current status.
@@ -93,23 +139,20 @@ class MicManager:
             if mic_id not in self._mics:
                 return
             status = self._mics[mic_id]
-            now = time.time()
+            now = time.monotonic()
             status.last_heartbeat = now
             status.rms_level = max(0.0, min(1.0, rms_level))
             status.vad_active = vad
             status.alive = True
 
-            # Publish heartbeat to MQTT
-            self._event_bus.publish(
-                "voice/mic/heartbeat",
-                {
-                    "mic_id": mic_id,
-                    "room_id": status.room_id,
-                    "rms": round(status.rms_level, 3),
-                    "vad": vad,
-                    "alive": True,
-                },
-            )
+            # Queue for the next batched publish; later beats replace earlier ones
+            self._pending_heartbeats[mic_id] = {
+                "mic_id": mic_id,
+                "room_id": status.room_id,
+                "rms": round(status.rms_level, 3),
+                "vad": vad,
+                "alive": True,
+            }
 
     def is_alive(self, mic_id: str) -> bool:
         """Check if a microphone is alive (heartbeat within timeout).
@@ -121,24 +164,25 @@ class MicManager:
         with self._lock:
             if mic_id not in self._mics:
                 return False
-            status = self._mics[mic_id]
-            now = time.time()
-            age = now - status.last_heartbeat
-            alive = age <= self._heartbeat_timeout
-            if status.alive != alive:
-                status.alive = alive
-                # Publish state change
-                self._event_bus.publish(
-                    "voice/mic/heartbeat",
-                    {
-                        "mic_id": mic_id,
-                        "room_id": status.room_id,
-                        "rms": round(status.rms_level, 3),
-                        "vad": status.vad_active,
-                        "alive": alive,
-                    },
-                )
-            return alive
+            return self._refresh_alive(self._mics[mic_id], time.monotonic())
+
+    def _refresh_alive(self, status: MicStatus, now: float) -> bool:
+        """Update ``status.alive`` and publish on change; caller holds the lock."""
+        alive = now - status.last_heartbeat <= self._heartbeat_timeout
+        if status.alive != alive:
+            status.alive = alive
+            # Publish state change
+            self._event_bus.publish(
+                "voice/mic/heartbeat",
+                {
+                    "mic_id": status.mic_id,
+                    "room_id": status.room_id,
+                    "rms": round(status.rms_level, 3),
+                    "vad": status.vad_active,
+                    "alive": alive,
+                },
+            )
+        return alive
 
     def best_mic_for_room(self, room_id: str) -> Optional[str]:
         """Get the best (alive) microphone for a room.
@@ -152,16 +196,22 @@ class MicManager:
         -------
         Microphone ID if found, None otherwise.
         """
+        # Selection is a pure single pass; alive/dead transitions are published
+        # by the background monitor (see sweep), not here.
         with self._lock:
-            candidates = []
+            now = time.monotonic()
+            timeout = self._heartbeat_timeout
+            best: Optional[str] = None
+            best_rms = -1.0
             for mic_id, status in self._mics.items():
-                if status.room_id == room_id and self.is_alive(mic_id):
-                    candidates.append((mic_id, status.rms_level))
-            if not candidates:
-                return None
-            # Return mic with highest RMS (assuming it's closest/most active)
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            return candidates[0][0]
+                # Highest RMS wins (assuming it's closest/most active); ties keep registration order
+                if (
+                    status.room_id == room_id
+                    and now - status.last_heartbeat <= timeout
+                    and status.rms_level > best_rms
+                ):
+                    best, best_rms = mic_id, status.rms_level
+            return best
 
     def capture_loop(
         self,
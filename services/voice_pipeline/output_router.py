@@ -6,7 +6,7 @@ from typing import Dict, Optional
 
 from orchestrator.logging.event_bus import EventBus
 from services.voice_pipeline.conversation_router import ConversationRouter
-from services.voice_pipeline.room_registry import RoomRegistry
+from services.voice_pipeline.room_registry import RoomRegistry, RoomRegistryError
 from services.voice_pipeline.wyoming_client import WyomingClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +47,13 @@ class OutputRouter:
             self._wyoming_clients[key] = WyomingClient(host, port)
         return self._wyoming_clients[key]
 
+    @staticmethod
+    def _output_target(profile: Dict) -> tuple[str, int]:
+        """Return (host, port) from a room profile, raising for unknown rooms."""
+        if profile["wyoming_host"] is None:
+            raise RoomRegistryError(f"Room '{profile['id']}' not found")
+        return profile["wyoming_host"], profile["wyoming_port"]
+
     def route(
         self,
         persona: str,
@@ -71,15 +78,18 @@ class OutputRouter:
         -------
         True if routing succeeded, False otherwise.
         """
+        # One registry lookup covers the zone checks and the output target
+        profile = self._room_registry.get_profile(room_id)
+
         # Check if speech is allowed in this room
-        if not self._conversation_router.can_speak_in(room_id, persona):
+        if not self._conversation_router.profile_allows_speech(profile, persona):
             # Privacy zone or DND: send chime only (or MQTT notification)
-            if self._room_registry.is_privacy_zone(room_id):
+            if profile["privacy"]:
                 _LOGGER.debug("Privacy zone %s: denying speech output", room_id)
                 # Send short chime or notification
                 chime = WyomingClient.create_chime_wav(duration_ms=200)
                 try:
-                    host, port = self._room_registry.get_output_target(room_id)
+                    host, port = self._output_target(profile)
                     client = self._get_wyoming_client(host, port)
                     client.send_tts_sync(chime)
                 except Exception as exc:
@@ -97,13 +107,13 @@ class OutputRouter:
                 )
                 return False
 
-            if self._room_registry.is_dnd_zone(room_id):
+            if profile["dnd"]:
                 # DND: allow SCARLET critical only
                 if persona != "SCARLET":
                     _LOGGER.debug("DND zone %s: denying speech for %s", room_id, persona)
                     chime = WyomingClient.create_chime_wav(duration_ms=150)
                     try:
-                        host, port = self._room_registry.get_output_target(room_id)
+                        host, port = self._output_target(profile)
                         client = self._get_wyoming_client(host, port)
                         client.send_tts_sync(chime)
                     except Exception as exc:
@@ -114,7 +124,7 @@ class OutputRouter:
 
         # Get Wyoming target for room
         try:
-            host, port = self._room_registry.get_output_target(room_id)
+            host, port = self._output_target(profile)
         except Exception as exc:
             _LOGGER.error("Failed to get output target for room %s: %s", room_id, exc)
             self._event_bus.publish(
@@ -187,6 +187,23 @@ class RoomRegistry:
             raise RoomRegistryError(f"Room '{room_id}' not found")
         return (room["wyoming_host"], room["wyoming_port"])
 
+    def get_profile(self, room_id: str) -> Dict:
+        """Get everything output routing needs about a room in one lookup.
+
+        Returns
+        -------
+        Dict with keys: id, privacy, dnd, wyoming_host, wyoming_port. Zone
+        flags are reported even for unknown rooms, whose host and port are None.
+        """
+        room = self._rooms.get(room_id)
+        return {
+            "id": room_id,
+            "privacy": room_id in self._privacy_zones,
+            "dnd": room_id in self._dnd_zones,
+            "wyoming_host": room["wyoming_host"] if room else None,
+            "wyoming_port": room["wyoming_port"] if room else None,
+        }
+
     def is_privacy_zone(self, room_id: str) -> bool:
         """Check if a room is a privacy zone.
 
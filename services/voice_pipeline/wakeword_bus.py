@@ -6,7 +6,7 @@ import time
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
-import redis
+from orchestrator.context.redis_pool import get_client
 
 
 @dataclass
@@ -37,7 +37,7 @@ class WakewordBus:
         collision_window_ms:
             Time window in milliseconds for collision detection (default 300ms).
         """
-        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self._redis = get_client(redis_url)
         self._collision_window = collision_window_ms / 1000.0
         self._subscribers: List[Callable[[WakeEvent], None]] = []
         self._lock = threading.RLock()
@@ -96,3 +96,24 @@ def test_guest_without_history_cannot_request_without_offer() -> None:
     request_result = handler.handle_add_request(guest_ctx, {"pick": 1})
     assert not request_result.ok
     assert "recommendation" in request_result.spoken.lower()
+
+
+def test_lowercase_persona_selects_persona_phrases() -> None:
+    options = [
+        {"tmdb_id": 1001, "type": "movie", "title": "Option A"},
+        {"tmdb_id": 2002, "type": "tv", "title": "Option B"},
+    ]
+    handler = MediaIntentHandler(
+        recommender=StubRecommender(options),  # type: ignore[arg-type]
+        overseerr=StubOverseerr(),             # type: ignore[arg-type]
+        event_bus=RecordingBus(),              # type: ignore[arg-type]
+        redis_url=f"memory://{uuid4()}",
+    )
+
+    ctx = IntentContext(role="owner", allow_sensitive=True, speaker_uuid="user-lower", persona="scarlet")
+    assert ctx.persona == "SCARLET"
+    assert handler.handle_recommend(ctx, {}).ok
+    assert handler.handle_add_request(ctx, {"pick": 1}).spoken == "Request filed."
+
+    halston = IntentContext(role="owner", allow_sensitive=True, speaker_uuid="user-lower", persona="halston")
+    assert handler.handle_add_to_list(halston, {"pick": 2}).spoken == "Added to your watchlist."
@@ -0,0 +1,97 @@
+"""Unit tests for the MQTT diagnostic event bus."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import paho.mqtt.client as mqtt
+
+from orchestrator.logging.event_bus import EventBus
+
+
+class RecordingClient:
+    """Captures publish calls in place of the paho client."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, dict]] = []
+
+    def publish(self, topic: str, payload, qos: int = 0, retain: bool = False):
+        self.published.append((topic, json.loads(payload)))
+        return True
+
+
+def test_publish_is_delivered_by_background_flusher() -> None:
+    bus = EventBus(base_topic="halcyon/")
+    client = RecordingClient()
+    bus._client = client  # type: ignore[assignment]
+
+    bus.publish("/orch/trust", {"score": 80})
+    bus.publish("orch/intent", {"intent": "turn_on_light"})
+    assert bus.flush(timeout=1.0)
+
+    assert [topic for topic, _ in client.published] == ["halcyon/orch/trust", "halcyon/orch/intent"]
+    assert client.published[0][1]["score"] == 80
+    assert "ts" in client.published[0][1]
+
+
+def test_buses_share_one_client_per_broker() -> None:
+    first = EventBus(host="broker.local", port=1884)
+    second = EventBus(host="broker.local", port=1884, base_topic="other")
+    third = EventBus(host="broker.local", port=1885)
+
+    assert first._client is second._client
+    assert first._client is not third._client
+    assert not hasattr(first._client, "_connection")
+
+    first.publish("orch/ping", {})
+    assert first.flush(timeout=1.0)
+    assert first._client._connection == ("broker.local", 1884, 25)
+
+
+def test_publish_many_shares_one_timestamp() -> None:
+    bus = EventBus(base_topic="halcyon")
+    client = RecordingClient()
+    bus._client = client  # type: ignore[assignment]
+
+    bus.publish_many([("media/error", {"code": "x"}), ("media/status", {"ok": False, "ts": 1.0})])
+    assert bus.flush(timeout=1.0)
+
+    (first_topic, first), (second_topic, second) = client.published
+    assert (first_topic, second_topic) == ("halcyon/media/error", "halcyon/media/status")
+    assert first["ts"] != second["ts"] == 1.0
+
+
+def test_queue_full_publishes_are_counted_as_dropped() -> None:
+    class FullQueueClient:
+        def publish(self, topic: str, payload, qos: int = 0, retain: bool = False):
+            return SimpleNamespace(rc=mqtt.MQTT_ERR_QUEUE_SIZE)
+
+    bus = EventBus()
+    bus._client = FullQueueClient()  # type: ignore[assignment]
+
+    bus.publish("orch/trust", {"score": 1})
+    bus.publish_many([("a", {}), ("b", {})])
+    assert bus.flush(timeout=1.0)
+
+    assert bus.dropped == 3
+
+
+def test_publish_struct_serializes_dataclass_events() -> None:
+    from ha_adapter.intents.intent_media import MediaErrorEvent
+
+    bus = EventBus(base_topic="halcyon")
+    client = RecordingClient()
+    bus._client = client  # type: ignore[assignment]
+
+    bus.publish_struct("media/error", MediaErrorEvent(uuid=None, code="boom", message="down"))
+    assert bus.flush(timeout=1.0)
+
+    topic, payload = client.published[0]
+    assert topic == "halcyon/media/error"
+    assert payload["code"] == "boom" and payload["uuid"] is None and payload["ts"] > 0
@@ -0,0 +1,42 @@
+"""Unit tests for the HALSTON persona agent."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from halston.runtime.halston_agent import HalstonAgent, HalstonConfig, IntentLexicon
+
+
+def _agent() -> HalstonAgent:
+    return HalstonAgent(
+        HalstonConfig(
+            intent_lexicon=[
+                IntentLexicon(intent="lights.on", keywords=["Light", "lamp"]),
+                IntentLexicon(intent="media.play", keywords=["play", "music"]),
+            ]
+        )
+    )
+
+
+def test_infer_intent_prefers_lexicon_order() -> None:
+    agent = _agent()
+
+    assert agent.infer_intent("Play something under the LAMP") == "lights.on"
+    assert agent.infer_intent("play some music") == "media.play"
+    assert agent.infer_intent("what time is it") == "general.assistance"
+    assert agent.infer_intent("anything", hint="custom.intent") == "custom.intent"
+
+
+def test_context_summary_tracks_history_evictions() -> None:
+    agent = HalstonAgent(HalstonConfig(max_history=2))
+
+    agent.generate_response("a", intent="lights.on", metadata={})
+    mixed = agent.generate_response("b", intent="media.play", metadata={})
+    assert "a mixture of tasks" in mixed
+
+    agent.generate_response("c", intent="media.play", metadata={})
+    assert agent._summarize_context() == "a series of 'media.play' tasks"
@@ -0,0 +1,51 @@
+"""Unit tests for the keyword message router."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from orchestrator.routing.message_router import MessageRouter, RouterConfig
+
+
+def test_cached_classification_hands_out_private_slots() -> None:
+    router = MessageRouter()
+
+    first = router.classify("Turn on the kitchen lights", "owner")
+    first.slots["entity_id"] = "light.mutated"
+    second = router.classify("turn on the kitchen lights ", "owner")
+
+    assert second.intent == "turn_on_light"
+    assert second.slots == {"entity_id": "light.kitchen"}
+
+
+def test_reassigning_config_invalidates_cache() -> None:
+    router = MessageRouter()
+    assert router.classify("turn on the hall light", "owner").slots["entity_id"] == "light.hallway"
+
+    router.config = RouterConfig(light_entities={"hall": "light.entry"})
+
+    assert router.classify("turn on the hall light", "owner").slots["entity_id"] == "light.entry"
+
+
+def test_surface_variants_share_one_cache_entry() -> None:
+    router = MessageRouter()
+
+    results = [
+        router.classify(text, "owner")
+        for text in ("Turn on the kitchen lights!", "turn on  the kitchen lights", "  TURN ON the kitchen lights? ")
+    ]
+
+    assert {result.slots["entity_id"] for result in results} == {"light.kitchen"}
+    assert router._classify_cached.cache_info().currsize == 1
+    assert router.classify("set the thermostat to -15.5", "owner").slots["temperature"] == -15.0
+
+
+def test_punctuation_only_text_is_not_treated_as_empty() -> None:
+    router = MessageRouter()
+
+    assert router.classify("?!", "owner").confidence == 0.3
+    assert router.classify("   ", "owner").confidence == 0.0
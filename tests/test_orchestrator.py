@@ -14,7 +14,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from ha_adapter.intents.intent_router import IntentRouter
+from ha_adapter.intents.intent_router import IntentRouter, _cached_result
 from halston.runtime.halston_agent import HalstonAgent
 from orchestrator.context.session_state import SessionStore
 from orchestrator.orchestrator import Orchestrator, OrchestratorDependencies
@@ -45,6 +45,10 @@ class TelemetryCollector:
     def publish(self, topic_suffix: str, payload: Dict[str, object]) -> None:
         self.messages.append((topic_suffix, dict(payload)))
 
+    def publish_many(self, events: List[Tuple[str, Dict[str, object]]]) -> None:
+        for topic_suffix, payload in events:
+            self.publish(topic_suffix, payload)
+
     def last_for(self, topic_suffix: str) -> Optional[Dict[str, object]]:
         for topic, payload in reversed(self.messages):
             if topic == topic_suffix:
@@ -211,3 +215,12 @@ def test_process_incident_mode_prefers_scarlet(orchestrator_factory) -> None:
     persona_event = collector.last_for("orch/active_persona")
     assert persona_event is not None
     assert persona_event["persona"] == "scarlet"
+
+
+def test_cached_intent_result_details_are_not_shared() -> None:
+    _cached_result(False, "regression phrase").to_dict()["details"]["leak"] = 1
+
+    result = _cached_result(False, "regression phrase")
+    assert dict(result.details) == {}
+    with pytest.raises(TypeError):
+        result.details["leak"] = 1  # type: ignore[index]
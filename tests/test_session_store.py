@@ -0,0 +1,85 @@
+"""Unit tests for the Redis-backed session store."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from orchestrator.context.session_state import SessionStore
+
+
+def test_touch_context_preserves_other_fields() -> None:
+    store = SessionStore(redis_url=f"memory://{uuid4()}")
+    state = store.load("owner-uuid", "speaker-1")
+    state.voice_confidence = 0.9
+    state.conversation_turn = 4
+    store.save(state, "owner-uuid", "speaker-1")
+
+    store.touch_context("owner-uuid", "speaker-1", "night")
+
+    reloaded = store.load("owner-uuid", "speaker-1")
+    assert reloaded.context_mode == "night"
+    assert reloaded.voice_confidence == 0.9
+    assert reloaded.conversation_turn == 4
+
+
+def test_touch_context_seeds_missing_session() -> None:
+    store = SessionStore(redis_url=f"memory://{uuid4()}")
+
+    store.touch_context(None, "guest-1", "away")
+
+    assert store.load(None, "guest-1").context_mode == "away"
+
+
+def test_save_round_trips_typed_fields() -> None:
+    store = SessionStore(redis_url=f"memory://{uuid4()}")
+    state = store.load(None, "guest-2")
+    state.last_trust = 72.5
+    state.conversation_turn = 3
+    state.last_intent = "lights.on"
+    store.save(state, None, "guest-2")
+
+    reloaded = store.load(None, "guest-2")
+    assert reloaded.speaker_uuid is None
+    assert reloaded.last_trust == 72.5
+    assert reloaded.conversation_turn == 3
+    assert reloaded.face_confidence is None
+    assert reloaded.last_intent == "lights.on"
+
+
+def test_load_migrates_legacy_json_session() -> None:
+    url = f"memory://{uuid4()}"
+    store = SessionStore(redis_url=url)
+    legacy = {"speaker_uuid": "owner-uuid", "last_trust": 81.0, "last_persona": "SCARLET", "conversation_turn": 2}
+    store._redis.set("halcyon:session:owner-uuid", json.dumps(legacy), ex=3600)
+
+    state = store.load("owner-uuid", "speaker-1")
+    assert state.last_trust == 81.0
+    assert state.last_persona == "SCARLET"
+    assert state.conversation_turn == 2
+    assert state.voice_confidence is None
+
+    store.touch_context("owner-uuid", "speaker-1", "night")
+    reloaded = store.load("owner-uuid", "speaker-1")
+    assert reloaded.context_mode == "night"
+    assert reloaded.last_trust == 81.0
+
+
+def test_touch_context_and_save_replace_legacy_json_session() -> None:
+    store = SessionStore(redis_url=f"memory://{uuid4()}")
+    store._redis.set("halcyon:session:guest:g1", json.dumps({"speaker_uuid": None, "threat": 4.0}), ex=3600)
+
+    store.touch_context(None, "g1", "away")
+    assert store.load(None, "g1").threat == 4.0
+
+    store._redis.set("halcyon:session:guest:g2", json.dumps({"speaker_uuid": None}), ex=3600)
+    state = store.load(None, "g2")
+    store._redis.set("halcyon:session:guest:g2", "{}", ex=3600)
+    state.conversation_turn = 5
+    store.save(state, None, "g2")
+    assert store.load(None, "g2").conversation_turn == 5
@@ -0,0 +1,67 @@
+"""Unit tests for the persona mode switching state machine."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from orchestrator.mode_switching.state_machine import (
+    ModeSwitchConfig,
+    PersonaState,
+    PersonaStateMachine,
+    ReassuranceSignal,
+    ThreatSignal,
+)
+
+
+def _machine() -> PersonaStateMachine:
+    return PersonaStateMachine(config=ModeSwitchConfig(cooldown_seconds=0.0))
+
+
+def test_escalates_only_on_sustained_high_severity() -> None:
+    machine = _machine()
+
+    machine.register_threat(ThreatSignal(severity=0.9, source="cv"))
+    assert machine.register_threat(ThreatSignal(severity=0.1, source="cv")) is PersonaState.HALSTON
+    assert machine.register_threat(ThreatSignal(severity=0.7, source="cv")) is PersonaState.HALSTON
+    assert machine.register_threat(ThreatSignal(severity=0.8, source="cv")) is PersonaState.SCARLET
+
+
+def test_deescalates_once_threat_evidence_ages_out() -> None:
+    machine = PersonaStateMachine(config=ModeSwitchConfig(cooldown_seconds=0.0, lookback_window=4))
+    machine.consume_bulk_signals(
+        threats=[ThreatSignal(severity=0.9, source="cv"), ThreatSignal(severity=0.9, source="cv")]
+    )
+    assert machine.state is PersonaState.SCARLET
+
+    machine.consume_bulk_signals(
+        threats=[ThreatSignal(severity=0.0, source="cv"), ThreatSignal(severity=0.0, source="cv")],
+        reassurances=[ReassuranceSignal(confidence=0.9, source="owner")] * 3,
+    )
+    assert machine.state is PersonaState.SCARLET
+
+    # Evicting one high-severity signal drops the window mean to 0.225.
+    assert machine.register_threat(ThreatSignal(severity=0.0, source="cv")) is PersonaState.HALSTON
+
+
+def test_running_aggregates_match_window_contents() -> None:
+    machine = PersonaStateMachine(
+        config=ModeSwitchConfig(cooldown_seconds=1e9, lookback_window=5, sustained_reassurance_count=3)
+    )
+    severities = [0.9, 0.2, 0.7, 0.8, 0.95, 0.1, 0.6, 0.65, 0.99, 0.3, 0.7, 0.75]
+    for index, severity in enumerate(severities):
+        machine.register_threat(ThreatSignal(severity=severity, source="cv"))
+        machine.register_reassurance(ReassuranceSignal(confidence=severity, source="owner"))
+
+        window = [sig.severity for sig in machine._threat_signals]
+        assert abs(machine._threat_sum - sum(window)) < 1e-9
+        trailing = 0
+        for value in reversed(severities[: index + 1]):
+            if value < machine.config.escalate_threshold:
+                break
+            trailing += 1
+        assert machine._high_severity_streak == trailing
+        assert abs(machine._recent_confidence_sum - sum(severities[max(0, index - 2) : index + 1])) < 1e-9
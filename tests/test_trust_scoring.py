@@ -0,0 +1,56 @@
+"""Unit tests for the trust scoring model."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from orchestrator.policy_engine import trust_scoring
+from orchestrator.policy_engine.trust_scoring import TrustInputs, TrustScorer
+
+
+def _batch_inputs():
+    modes = ("home", "maintenance", "night", "away", "incident", "unlisted")
+    inputs = [
+        TrustInputs(
+            speaker_id=f"s{idx}",
+            voice_match=(idx % 10) / 10.0 if idx % 3 else None,
+            face_match=((idx * 7) % 10) / 10.0 if idx % 4 else None,
+            prior_score=float((idx * 13) % 100),
+            context_mode=modes[idx % len(modes)],  # type: ignore[arg-type]
+            reassurance=float((idx % 9) * 6 - 24),
+            threat=float((idx % 7) * 6 - 3),
+            last_update_ts=100.0 if idx % 2 else 0.0,
+            now_ts=100.0 + idx % 30,
+        )
+        for idx in range(40)
+    ]
+    hints = ["owner" if idx % 5 == 0 else None for idx in range(40)]
+    return inputs, hints
+
+
+def _assert_batch_matches_scalar(scorer: TrustScorer) -> None:
+    inputs, hints = _batch_inputs()
+
+    batch = scorer.score_batch(inputs, hints)
+    single = [scorer.score(inp, hint) for inp, hint in zip(inputs, hints)]
+
+    assert [(d.score, d.role, d.allow_sensitive, d.persona_bias) for d in batch] == [
+        (d.score, d.role, d.allow_sensitive, d.persona_bias) for d in single
+    ]
+
+
+def test_score_batch_vectorized_matches_scalar_scoring() -> None:
+    pytest.importorskip("numpy")
+    assert trust_scoring.np is not None
+    _assert_batch_matches_scalar(TrustScorer())
+
+
+def test_score_batch_fallback_matches_scalar_scoring(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(trust_scoring, "np", None)
+    _assert_batch_matches_scalar(TrustScorer())
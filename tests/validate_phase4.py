@@ -39,6 +39,10 @@ class TelemetryCollector:
         self.messages.append((topic_suffix, payload))
         print(f"[MQTT] {topic_suffix}: {payload}")
 
+    def publish_many(self, events: list) -> None:
+        for topic_suffix, payload in events:
+            self.publish(topic_suffix, payload)
+
 
 def setup_orchestrator() -> Orchestrator:
     """Set up orchestrator with dependencies."""
@@ -151,3 +151,92 @@ rooms:
     finally:
         os.unlink(temp_path)
 
+
+
+def test_set_room_lock_moves_existing_lock():
+    """Test that set_room_lock overwrites a lock while try_acquire_room_lock does not."""
+    yaml_content = """
+rooms:
+  - id: lounge
+    wyoming_host: 127.0.0.1
+    wyoming_port: 10700
+    mics: []
+  - id: kitchen
+    wyoming_host: 127.0.0.1
+    wyoming_port: 10710
+    mics: []
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_content)
+        temp_path = f.name
+
+    try:
+        registry = RoomRegistry(rooms_config_path=temp_path)
+        router = ConversationRouter(registry, redis_url="memory://test")
+
+        uuid = "test-uuid-lock"
+
+        assert router.try_acquire_room_lock(uuid, "lounge") is True
+        assert router.select_active_room(uuid, "mic:test:0") == "lounge"
+
+        # A second acquire must not steal the lock
+        assert router.try_acquire_room_lock(uuid, "kitchen") is False
+        assert router.select_active_room(uuid, "mic:test:0") == "lounge"
+
+        # Setting the lock moves it
+        router.set_room_lock(uuid, "kitchen")
+        assert router.select_active_room(uuid, "mic:test:0") == "kitchen"
+
+        router.set_room_lock(uuid, None)
+        assert router.release_room_lock(uuid, "kitchen") is False
+    finally:
+        os.unlink(temp_path)
+
+
+
+def test_room_state_cache_survives_concurrent_invalidate():
+    """Test that an invalidation from another thread mid-select cannot break the cache."""
+    import threading
+    from collections import OrderedDict
+
+    yaml_content = """
+rooms:
+  - id: lounge
+    wyoming_host: 127.0.0.1
+    wyoming_port: 10700
+    mics: []
+  - id: kitchen
+    wyoming_host: 127.0.0.1
+    wyoming_port: 10710
+    mics: []
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_content)
+        temp_path = f.name
+
+    try:
+        registry = RoomRegistry(rooms_config_path=temp_path)
+        router = ConversationRouter(registry, redis_url="memory://test-concurrent")
+        uuid = "test-uuid-concurrent"
+        invalidators = []
+
+        class InterleavingCache(OrderedDict):
+            """Runs a concurrent set_room_lock right after each cache insert."""
+
+            def __setitem__(self, key, value):
+                super().__setitem__(key, value)
+                thread = threading.Thread(target=router.set_room_lock, args=(uuid, "kitchen"))
+                invalidators.append(thread)
+                thread.start()
+                thread.join(timeout=0.2)  # blocks here only if the cache is unguarded
+
+        router._room_state_cache = InterleavingCache()
+
+        assert router.select_active_room(uuid, "mic:test:0") in {"lounge", "kitchen"}
+        for thread in invalidators:
+            thread.join()
+        assert router.select_active_room(uuid, "mic:test:0") == "kitchen"
+    finally:
+        os.unlink(temp_path)